@@ -26,6 +26,13 @@ class Config:
     # MCP Configuration (package installed directly in container)
     MCP_COMMAND: str = "blitz-agent-mcp"  # Installed package command
     
+    # Database connection handed to the MCP server
+    POSTGRES_HOST: Optional[str] = os.getenv("POSTGRES_HOST")
+    POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
+    POSTGRES_USER: str = os.getenv("POSTGRES_USER", "postgres")
+    POSTGRES_PASSWORD: Optional[str] = os.getenv("POSTGRES_PASSWORD")
+    POSTGRES_SSL: str = os.getenv("POSTGRES_SSL", "true")
+    
     @classmethod
     def validate(cls) -> None:
         """Validate required configuration."""
@@ -7,8 +7,13 @@ Anthropic's most advanced reasoning model with superior intelligence.
 
 import asyncio
 import logging
+import os
+import shutil
+import time
+import traceback
 from datetime import datetime
-from typing import Optional, Any, Dict
+from functools import lru_cache
+from typing import Optional, Any, Dict, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, Header
@@ -17,10 +22,10 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.messages import PartDeltaEvent, PartStartEvent, TextPart, TextPartDelta
 from pydantic_ai.models.anthropic import AnthropicModel
 from dotenv import load_dotenv
 import json
-import asyncio
 from typing import AsyncGenerator
 
 from config import Config
@@ -48,6 +53,10 @@ class StreamEvent(BaseModel):
     data: Optional[Dict[str, Any]] = Field(None, description="Additional event data")
     timestamp: str = Field(..., description="ISO timestamp of the event")
 
+# Streamed model text is coalesced into chunks of at least this many characters
+# (the first chunk of each model response is always sent immediately)
+STREAM_DELTA_MIN_CHARS = 64
+
 # System prompt template
 SYSTEM_PROMPT_TEMPLATE = """
 Today's Date: {current_date}
@@ -205,6 +214,61 @@ You have access to dedicated betting tools that automatically handle API authent
 {user_provided_context}
 """
 
+# The template splits around the per-request user context; everything before it
+# only depends on the date and is rendered once per day
+_SYSTEM_PROMPT_HEAD, _SYSTEM_PROMPT_TAIL = SYSTEM_PROMPT_TEMPLATE.split("{user_provided_context}")
+
+@lru_cache(maxsize=4)
+def _base_system_prompt(current_date: str) -> str:
+    """Render the context-independent part of the system prompt for a date."""
+    # str.replace rather than str.format: the template contains literal
+    # placeholders like {player} that are meant for the model
+    return _SYSTEM_PROMPT_HEAD.replace("{current_date}", current_date)
+
+# Environment overrides passed to the MCP server subprocess
+_MCP_ENV_OVERRIDES = {
+    "LOG_LEVEL": "INFO",  # FastMCP expects uppercase log level
+    "FASTMCP_LOG_LEVEL": "INFO",  # Alternative env var name
+    "MCP_LOG_LEVEL": "INFO",  # Another possible env var name
+    "SKIP_MCP_CONNECTION_TEST": "true",  # Skip database connection test during startup
+    "POSTGRES_USER": Config.POSTGRES_USER,
+    "POSTGRES_PORT": Config.POSTGRES_PORT,
+    "POSTGRES_SSL": Config.POSTGRES_SSL,
+}
+# Database host and password come from the environment; one password serves every league
+if Config.POSTGRES_HOST:
+    _MCP_ENV_OVERRIDES["POSTGRES_HOST"] = Config.POSTGRES_HOST
+if Config.POSTGRES_PASSWORD:
+    for _password_var in ("POSTGRES_PASSWORD", "POSTGRES_MLB_PASSWORD", "POSTGRES_NBA_PASSWORD"):
+        _MCP_ENV_OVERRIDES[_password_var] = Config.POSTGRES_PASSWORD
+
+# Conflicting variables that might hardcode the MCP server to MLB
+_MCP_ENV_EXCLUDED = frozenset({"DATABASE_URL", "POSTGRES_DATABASE"})
+
+# Liveness probing and restart backoff (seconds) for the long-lived MCP server
+_MCP_PROBE_INTERVAL = 60.0
+_MCP_PROBE_TIMEOUT = 15.0
+_MCP_RESTART_MAX_DELAY = 60.0
+
+def _build_mcp_env() -> Dict[str, str]:
+    """Build the MCP subprocess environment from the current process environment."""
+    mcp_env = {k: v for k, v in os.environ.items() if k not in _MCP_ENV_EXCLUDED}
+    mcp_env.update(_MCP_ENV_OVERRIDES)
+    return mcp_env
+
+@lru_cache(maxsize=1)
+def _resolve_mcp_command() -> Tuple[str, Tuple[str, ...]]:
+    """Resolve the MCP server command once per process."""
+    # Check if blitz-agent-mcp command exists
+    if shutil.which(Config.MCP_COMMAND):
+        logger.info(f"Found {Config.MCP_COMMAND} command")
+        return Config.MCP_COMMAND, ()
+    if shutil.which("python"):
+        # Fallback: run as Python module
+        logger.info("Using Python module execution as fallback")
+        return "python", ("-m", "blitz_agent_mcp.main")
+    raise Exception("Neither blitz-agent-mcp nor python command found")
+
 class SportsAnalysisAgent:
     def __init__(self):
         """Initialize the sports analysis agent with Claude 4 Sonnet and MCP tools."""
@@ -220,53 +284,17 @@ class SportsAnalysisAgent:
         self.model = AnthropicModel("claude-sonnet-4-20250514")
         
         # Initialize MCP server to connect to the Blitz MCP server
-        import os
-        mcp_env = os.environ.copy()  # Inherit all environment variables
-        mcp_env["LOG_LEVEL"] = "INFO"  # FastMCP expects uppercase log level
-        mcp_env["FASTMCP_LOG_LEVEL"] = "INFO"  # Alternative env var name
-        mcp_env["MCP_LOG_LEVEL"] = "INFO"  # Another possible env var name
-        mcp_env["SKIP_MCP_CONNECTION_TEST"] = "true"  # Skip database connection test during startup
-        
-        # Set correct database credentials explicitly (from config.json)
-        correct_password = "_V8fn.eo62B(gZD|OcQcu~0|aP8["
-        mcp_env["POSTGRES_PASSWORD"] = correct_password
-        mcp_env["POSTGRES_MLB_PASSWORD"] = correct_password
-        mcp_env["POSTGRES_NBA_PASSWORD"] = correct_password
-        mcp_env["POSTGRES_USER"] = "postgres"
-        mcp_env["POSTGRES_HOST"] = "blitz-instance-1.cdu6kma429k4.us-west-2.rds.amazonaws.com"
-        mcp_env["POSTGRES_PORT"] = "5432"
-        mcp_env["POSTGRES_SSL"] = "true"
-        
-        # Clear any conflicting variables that might hardcode to MLB
-        mcp_env.pop("DATABASE_URL", None)
-        mcp_env.pop("POSTGRES_DATABASE", None)  # Don't hardcode database name
+        mcp_env = _build_mcp_env()
         
         try:
             # Try to use installed package command first
             logger.info("Attempting to initialize MCP server from installed package")
-            
-            # Try different command approaches
-            import shutil
-            mcp_command = None
-            mcp_args = []
-            
-            # Check if blitz-agent-mcp command exists
-            if shutil.which("blitz-agent-mcp"):
-                mcp_command = "blitz-agent-mcp"
-                mcp_args = []
-                logger.info("Found blitz-agent-mcp command")
-            elif shutil.which("python"):
-                # Fallback: run as Python module
-                mcp_command = "python"
-                mcp_args = ["-m", "blitz_agent_mcp.main"]
-                logger.info("Using Python module execution as fallback")
-            else:
-                raise Exception("Neither blitz-agent-mcp nor python command found")
+            mcp_command, mcp_args = _resolve_mcp_command()
             
             # Run the MCP server
             self.mcp_server = MCPServerStdio(
                 command=mcp_command,
-                args=mcp_args,
+                args=list(mcp_args),
                 env=mcp_env  # Pass environment with correct credentials
             )
             logger.info("MCP server initialized successfully")
@@ -317,11 +345,63 @@ class SportsAnalysisAgent:
             logger.warning("Agent created WITHOUT MCP tools - sports analysis will not work!")
             
         self.mcp_available = self.mcp_server is not None
+        self.mcp_connected = False  # True while the long-lived MCP session is up
+        self._mcp_task: Optional[asyncio.Task] = None
+        self._mcp_stop = asyncio.Event()
         
         # Add dynamic system prompt
         @self.agent.system_prompt
         def get_system_prompt(ctx) -> str:
             return self._get_system_prompt(ctx)
+
+    def start(self):
+        """Start the MCP server in the background so agent runs reuse it instead of spawning it per request.
+
+        Runs that arrive before the server is up start it themselves, as before.
+        """
+        if self.mcp_server and self._mcp_task is None:
+            self._mcp_task = asyncio.create_task(self._hold_mcp_server())
+
+    async def _hold_mcp_server(self):
+        """Keep the MCP server entered until stop() is called, restarting it if it dies."""
+        delay = 1.0
+        while not self._mcp_stop.is_set():
+            # Entered and exited in this one task, as the stdio client's task group requires
+            try:
+                async with self.mcp_server:
+                    self.mcp_connected = True
+                    delay = 1.0
+                    logger.info("MCP server started for the lifetime of the app")
+                    await self._watch_mcp_server()
+            except Exception:
+                logger.exception("MCP server stopped unexpectedly; runs will start it per request until it restarts")
+            finally:
+                self.mcp_connected = False
+            
+            if self._mcp_stop.is_set():
+                break
+            try:
+                await asyncio.wait_for(self._mcp_stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, _MCP_RESTART_MAX_DELAY)
+
+    async def _watch_mcp_server(self):
+        """Return once stop() is called; raise if the MCP server stops answering."""
+        while True:
+            try:
+                await asyncio.wait_for(self._mcp_stop.wait(), timeout=_MCP_PROBE_INTERVAL)
+                return
+            except asyncio.TimeoutError:
+                pass
+            # Fails once the subprocess or its session has gone away
+            await asyncio.wait_for(self.mcp_server.list_tools(), timeout=_MCP_PROBE_TIMEOUT)
+
+    async def stop(self):
+        """Shut down the long-lived MCP server."""
+        if self._mcp_task:
+            self._mcp_stop.set()
+            await self._mcp_task
         
     def _get_system_prompt(self, ctx) -> str:
         """Generate the system prompt with current context."""
@@ -338,12 +418,12 @@ class SportsAnalysisAgent:
         if image:
             user_context_parts.append(f"### Here is the base64 image url the user is providing as context:\n{image}")
         
-        user_provided_context = "\n\n".join(user_context_parts) if user_context_parts else ""
+        base_prompt = _base_system_prompt(datetime.now().strftime("%Y-%m-%d"))
+        if not user_context_parts:
+            return base_prompt + _SYSTEM_PROMPT_TAIL
         
-        return SYSTEM_PROMPT_TEMPLATE.format(
-            current_date=datetime.now().strftime("%Y-%m-%d"),
-            user_provided_context=f"\n\n{user_provided_context}" if user_provided_context else ""
-        )
+        user_provided_context = "\n\n".join(user_context_parts)
+        return f"{base_prompt}\n\n{user_provided_context}{_SYSTEM_PROMPT_TAIL}"
     
     async def analyze(self, request: AnalysisRequest) -> AnalysisResponse:
         """Perform sports analysis using the agent with retry logic."""
@@ -385,7 +465,6 @@ class SportsAnalysisAgent:
                 )
                 
             except Exception as e:
-                import traceback
                 error_details = traceback.format_exc()
                 last_error = e
                 logger.warning(f"Analysis attempt {attempt + 1} failed: {str(e)}")
@@ -401,9 +480,44 @@ class SportsAnalysisAgent:
                         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
                 
                 # Wait a bit before retrying
-                import asyncio
                 await asyncio.sleep(1)
     
+    async def _stream_text_deltas(self, node, ctx) -> AsyncGenerator[StreamEvent, None]:
+        """Forward text deltas from a model request node as text_delta events."""
+        buffer = []
+        buffered_chars = 0
+        sent_first = False
+        
+        def flush() -> StreamEvent:
+            return StreamEvent(
+                event_type="text_delta",
+                message="Model output",
+                data={"delta": "".join(buffer)},
+                timestamp=datetime.now().isoformat()
+            )
+        
+        async with node.stream(ctx) as request_stream:
+            async for event in request_stream:
+                if isinstance(event, PartStartEvent) and isinstance(event.part, TextPart):
+                    text = event.part.content
+                elif isinstance(event, PartDeltaEvent) and isinstance(event.delta, TextPartDelta):
+                    text = event.delta.content_delta
+                else:
+                    continue
+                if not text:
+                    continue
+                
+                buffer.append(text)
+                buffered_chars += len(text)
+                if not sent_first or buffered_chars >= STREAM_DELTA_MIN_CHARS:
+                    yield flush()
+                    buffer.clear()
+                    buffered_chars = 0
+                    sent_first = True
+        
+        if buffer:
+            yield flush()
+    
     async def stream_analyze(self, request: AnalysisRequest) -> AsyncGenerator[StreamEvent, None]:
         """Perform sports analysis with streaming events that capture real agent execution."""
         try:
@@ -425,36 +539,46 @@ class SportsAnalysisAgent:
             async with self.agent.iter(request.query, deps=deps) as agent_run:
                 async for node in agent_run:
                     
+                    # Stream model text as it is generated instead of waiting for the full response
+                    if Agent.is_model_request_node(node):
+                        async for delta_event in self._stream_text_deltas(node, agent_run.ctx):
+                            yield delta_event
+                    
                     # Capture user prompt node (useful)
-                    if hasattr(node, 'user_prompt') and node.user_prompt:
+                    user_prompt = getattr(node, 'user_prompt', None)
+                    if user_prompt:
                         yield StreamEvent(
                             event_type="user_prompt",
-                            message=f"Processing user query: '{node.user_prompt}'",
-                            data={"prompt": node.user_prompt},
+                            message=f"Processing user query: '{user_prompt}'",
+                            data={"prompt": user_prompt},
                             timestamp=datetime.now().isoformat()
                         )
                     
                     # Skip model_request events (not useful for user)
                     
                     # Capture model response and tool calls
-                    if hasattr(node, 'model_response') and node.model_response:
-                        response = node.model_response
+                    response = getattr(node, 'model_response', None)
+                    if response:
                         
                         # Extract tool calls from the response
                         tool_calls = []
                         text_parts = []
                         
                         for part in response.parts:
-                            if hasattr(part, 'tool_name'):  # ToolCallPart
+                            tool_name = getattr(part, 'tool_name', None)
+                            if tool_name is not None:  # ToolCallPart
                                 tool_calls.append({
-                                    "tool_name": part.tool_name,
+                                    "tool_name": tool_name,
                                     "tool_call_id": getattr(part, 'tool_call_id', None),
-                                    "args": part.args if hasattr(part, 'args') else {}
+                                    "args": getattr(part, 'args', {})
                                 })
-                            elif hasattr(part, 'content'):  # TextPart
-                                text_parts.append(part.content)
+                            else:
+                                part_content = getattr(part, 'content', None)
+                                if part_content is not None:  # TextPart
+                                    text_parts.append(part_content)
                         
-                        # Emit model thinking/reasoning
+                        # Emit model thinking/reasoning; repeats the text already streamed as
+                        # text_delta events so clients that only read this event still get it
                         if text_parts:
                             yield StreamEvent(
                                 event_type="model_reasoning",
@@ -462,7 +586,7 @@ class SportsAnalysisAgent:
                                 data={
                                     "reasoning": " ".join(text_parts),
                                     "model_name": response.model_name,
-                                    "timestamp": response.timestamp.isoformat() if hasattr(response, 'timestamp') else datetime.now().isoformat()
+                                    "timestamp": (getattr(response, 'timestamp', None) or datetime.now()).isoformat()
                                 },
                                 timestamp=datetime.now().isoformat()
                             )
@@ -482,11 +606,11 @@ class SportsAnalysisAgent:
                             )
                         
                         # Emit usage information (useful for monitoring)
-                        if hasattr(response, 'usage') and response.usage:
+                        usage = getattr(response, 'usage', None)
+                        if usage:
                             try:
-                                usage_data = response.usage.model_dump() if hasattr(response.usage, 'model_dump') else {
-                                    "tokens": str(response.usage)
-                                }
+                                model_dump = getattr(usage, 'model_dump', None)
+                                usage_data = model_dump() if model_dump else {"tokens": str(usage)}
                             except:
                                 usage_data = {"tokens": "unavailable"}
                             
@@ -501,29 +625,33 @@ class SportsAnalysisAgent:
                             )
                     
                     # Capture tool results (useful for debugging MCP tools)
-                    if hasattr(node, 'tool_results') and node.tool_results:
-                        for tool_result in node.tool_results:
+                    tool_results = getattr(node, 'tool_results', None)
+                    if tool_results:
+                        for tool_result in tool_results:
                             # Extract tool result information
                             tool_name = getattr(tool_result, 'tool_name', 'unknown')
                             tool_call_id = getattr(tool_result, 'tool_call_id', None)
                             
-                            # Get result content
+                            # Get result content; parts without .content fall back to str(part)
                             if hasattr(tool_result, 'content'):
-                                if isinstance(tool_result.content, str):
-                                    content = tool_result.content
-                                elif hasattr(tool_result.content, 'text'):
-                                    content = tool_result.content.text
+                                raw_content = tool_result.content
+                                if isinstance(raw_content, str):
+                                    content = raw_content
+                                elif hasattr(raw_content, 'text'):
+                                    content = raw_content.text
                                 else:
-                                    content = str(tool_result.content)
+                                    content = str(raw_content)
                             else:
+                                raw_content = tool_result
                                 content = str(tool_result)
+                            content_length = len(str(raw_content))
                             
                             # Truncate very long results for readability
                             if len(content) > 1000:
                                 content = content[:1000] + "... (truncated)"
                             
                             # Check for errors
-                            is_error = hasattr(tool_result, 'is_error') and tool_result.is_error
+                            is_error = bool(getattr(tool_result, 'is_error', False))
                             
                             yield StreamEvent(
                                 event_type="tool_result",
@@ -533,7 +661,7 @@ class SportsAnalysisAgent:
                                     "tool_call_id": tool_call_id,
                                     "content": content,
                                     "is_error": is_error,
-                                    "content_length": len(str(tool_result.content if hasattr(tool_result, 'content') else tool_result))
+                                    "content_length": content_length
                                 },
                                 timestamp=datetime.now().isoformat()
                             )
@@ -548,23 +676,18 @@ class SportsAnalysisAgent:
                         except:
                             usage_data = {"tokens": "unavailable"}
                     
+                    # Single terminal event carrying the response, as documented for clients
                     yield StreamEvent(
                         event_type="analysis_complete",
                         message="Analysis completed successfully!",
                         data={
+                            "response": agent_run.result.output,
                             "response_length": len(agent_run.result.output),
                             "usage": usage_data,
                             "message_count": len(agent_run.result.all_messages())
                         },
                         timestamp=datetime.now().isoformat()
                     )
-                    
-                    yield StreamEvent(
-                        event_type="final_result",
-                        message="Final analysis result ready",
-                        data={"response": agent_run.result.output},
-                        timestamp=datetime.now().isoformat()
-                    )
                 else:
                     yield StreamEvent(
                         event_type="error",
@@ -600,12 +723,17 @@ from typing import Dict, Optional
 from datetime import datetime
 import hashlib
 
+def _api_key_digest(api_key: str) -> str:
+    """Stable digest of an API key, used as the client index key."""
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
+
 class ClientAuth:
     """Manages multiple client API keys and authentication."""
     
     def __init__(self):
         self.clients: Dict[str, Dict] = {}
         self.load_clients()
+        self._client_ids_by_key = self._index_clients()
     
     def load_clients(self):
         """Load client API keys from environment or file."""
@@ -621,7 +749,6 @@ class ClientAuth:
         # Try to load from file
         if Config.API_KEYS_FILE:
             try:
-                import os
                 if os.path.exists(Config.API_KEYS_FILE):
                     with open(Config.API_KEYS_FILE, 'r') as f:
                         self.clients = json.load(f)
@@ -645,17 +772,27 @@ class ClientAuth:
         else:
             logger.warning("No API keys configured!")
     
+    def _index_clients(self) -> Dict[str, str]:
+        """Map API key digests to enabled client IDs (first match wins)."""
+        index: Dict[str, str] = {}
+        for client_id, client_data in self.clients.items():
+            api_key = client_data.get("api_key")
+            if api_key and client_data.get("enabled", True):
+                index.setdefault(_api_key_digest(api_key), client_id)
+        return index
+    
     def authenticate(self, api_key: str) -> Optional[Dict]:
         """Authenticate API key and return client info."""
-        for client_id, client_data in self.clients.items():
-            if client_data.get("api_key") == api_key and client_data.get("enabled", True):
-                return {
-                    "client_id": client_id,
-                    "name": client_data.get("name", client_id),
-                    "rate_limit": client_data.get("rate_limit", 100),
-                    "metadata": client_data.get("metadata", {})
-                }
-        return None
+        client_id = self._client_ids_by_key.get(_api_key_digest(api_key))
+        if client_id is None:
+            return None
+        client_data = self.clients[client_id]
+        return {
+            "client_id": client_id,
+            "name": client_data.get("name", client_id),
+            "rate_limit": client_data.get("rate_limit", 100),
+            "metadata": client_data.get("metadata", {})
+        }
 
 # Initialize client authentication
 client_auth = ClientAuth()
@@ -688,9 +825,26 @@ async def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(sec
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management."""
+    app.state.start_time = time.monotonic()
+
     logger.info("Starting Pydantic AI Sports Agent")
+    try:
+        app.state.agent = SportsAnalysisAgent()
+        logger.info("Sports agent initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize sports agent: {e}")
+        app.state.agent = None
+
+    # Spawning the MCP server and its handshake happen in the background so
+    # the app starts accepting requests (and health checks) immediately
+    if app.state.agent:
+        app.state.agent.start()
+
     yield
+
     logger.info("Shutting down Pydantic AI Sports Agent")
+    if app.state.agent:
+        await app.state.agent.stop()
 
 app = FastAPI(
     title="Pydantic AI Sports Agent",
@@ -702,7 +856,8 @@ app = FastAPI(
 async def event_stream(request: AnalysisRequest) -> AsyncGenerator[str, None]:
     """Convert analysis events to Server-Sent Events format."""
     # Get the agent from app state
-    if not hasattr(app.state, 'agent') or not app.state.agent:
+    agent = getattr(app.state, 'agent', None)
+    if not agent:
         error_event = {
             "event_type": "error",
             "message": "Sports analysis service is not initialized",
@@ -711,41 +866,19 @@ async def event_stream(request: AnalysisRequest) -> AsyncGenerator[str, None]:
         yield f"data: {json.dumps(error_event)}\n\n"
         return
     
-    async for event in app.state.agent.stream_analyze(request):
-        # Format as SSE
-        event_data = json.dumps(event.model_dump())
-        yield f"data: {event_data}\n\n"
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the sports agent on startup."""
-    import time
-    app.state.start_time = time.time()
-    
-    logger.info("Starting Pydantic AI Sports Agent")
-    try:
-        app.state.agent = SportsAnalysisAgent()
-        logger.info("Sports agent initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize sports agent: {e}")
-        app.state.agent = None
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up on shutdown."""
-    logger.info("Shutting down Pydantic AI Sports Agent")
+    async for event in agent.stream_analyze(request):
+        # Format as SSE; pydantic's serializer skips the intermediate dict
+        yield f"data: {event.model_dump_json()}\n\n"
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint to verify system status."""
-    import time
-    from datetime import datetime
-    
     # Check if agent is available
-    agent_status = "up" if hasattr(app.state, 'agent') and app.state.agent else "down"
+    agent = getattr(app.state, 'agent', None)
+    agent_status = "up" if agent else "down"
     
-    # Check MCP server status
-    mcp_status = "connected" if hasattr(app.state, 'agent') and app.state.agent and app.state.agent.mcp_available else "disconnected"
+    # Check MCP server status; reflects the long-lived session, not just configuration
+    mcp_status = "connected" if agent and agent.mcp_connected else "disconnected"
     
     # Check Anthropic API (basic check)
     anthropic_status = "available" if Config.ANTHROPIC_API_KEY else "unavailable"
@@ -758,17 +891,20 @@ async def health_check():
     else:
         overall_status = "unhealthy"
     
+    now = datetime.utcnow().isoformat() + "Z"
+    start_time = getattr(app.state, 'start_time', None)
+    
     return {
         "status": overall_status,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": now,
         "services": {
             "api": {
                 "status": agent_status,
-                "uptime": int(time.time() - app.state.start_time) if hasattr(app.state, 'start_time') else 0
+                "uptime": int(time.monotonic() - start_time) if start_time is not None else 0
             },
             "mcp_server": {
                 "status": mcp_status,
-                "last_check": datetime.utcnow().isoformat() + "Z",
+                "last_check": now,
                 "tools_available": 12 if mcp_status == "connected" else 0
             },
             "anthropic": {
@@ -797,10 +933,11 @@ async def analyze_sports_query(
     logger.info(f"Analysis request from {client_info['name']} ({client_info['client_id']}): {request.query[:100]}...")
     
     # Get the agent from app state
-    if not hasattr(app.state, 'agent') or not app.state.agent:
+    agent = getattr(app.state, 'agent', None)
+    if not agent:
         raise HTTPException(status_code=503, detail="Sports analysis service is not initialized")
     
-    return await app.state.agent.analyze(request)
+    return await agent.analyze(request)
 
 @app.post("/analyze/stream")
 async def stream_sports_analysis(
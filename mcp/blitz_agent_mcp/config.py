@@ -2,6 +2,7 @@
 
 import os
 import json
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote_plus
 
@@ -31,6 +32,9 @@ try:
 except Exception:
     pass
 
+# Bundled league schema documentation
+SCHEMAS_DIR = Path(__file__).resolve().parent / "schemas"
+
 # Database settings
 MAX_DATA_ROWS = int(os.getenv("MAX_DATA_ROWS", "1000"))
 
@@ -85,32 +89,33 @@ SPORTSDATA_API_KEY=os.getenv("SPORTSDATA_API_KEY", config_data.get("services", {
 
 GEMINI_API_KEY=os.getenv("GEMINI_API_KEY")
 
+# Connection settings (host, port, database, user, password, ssl) per league
+_DEFAULT_POSTGRES_SETTINGS = (
+    POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DATABASE,
+    POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_SSL
+)
+_LEAGUE_POSTGRES_SETTINGS = {
+    "mlb": (
+        POSTGRES_MLB_HOST, POSTGRES_MLB_PORT, POSTGRES_MLB_DATABASE,
+        POSTGRES_MLB_USER, POSTGRES_MLB_PASSWORD, POSTGRES_MLB_SSL
+    ),
+    "nba": (
+        POSTGRES_NBA_HOST, POSTGRES_NBA_PORT, POSTGRES_NBA_DATABASE,
+        POSTGRES_NBA_USER, POSTGRES_NBA_PASSWORD, POSTGRES_NBA_SSL
+    ),
+}
+
+@lru_cache(maxsize=32)
 def get_postgres_url(league: str = None):
-    """Build PostgreSQL connection URL from configuration for specified league."""
-    if league:
-        league = league.lower()
-        if league == "mlb":
-            host, port, database, user, password, ssl = (
-                POSTGRES_MLB_HOST, POSTGRES_MLB_PORT, POSTGRES_MLB_DATABASE, 
-                POSTGRES_MLB_USER, POSTGRES_MLB_PASSWORD, POSTGRES_MLB_SSL
-            )
-        elif league == "nba":
-            host, port, database, user, password, ssl = (
-                POSTGRES_NBA_HOST, POSTGRES_NBA_PORT, POSTGRES_NBA_DATABASE,
-                POSTGRES_NBA_USER, POSTGRES_NBA_PASSWORD, POSTGRES_NBA_SSL
-            )
-        else:
-            # Fallback to default postgres config for unknown leagues
-            host, port, database, user, password, ssl = (
-                POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DATABASE,
-                POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_SSL
-            )
-    else:
-        # Default behavior when no league specified
-        host, port, database, user, password, ssl = (
-            POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DATABASE,
-            POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_SSL
-        )
+    """Build PostgreSQL connection URL from configuration for specified league.
+
+    Settings are fixed at import, so the URL is built once per league.
+    """
+    # Unknown leagues and no league fall back to the default postgres config
+    host, port, database, user, password, ssl = (
+        _LEAGUE_POSTGRES_SETTINGS.get(league.lower(), _DEFAULT_POSTGRES_SETTINGS)
+        if league else _DEFAULT_POSTGRES_SETTINGS
+    )
     
     if all([host, port, database, user, password]):
         # URL encode the password to handle special characters
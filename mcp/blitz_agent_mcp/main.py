@@ -18,7 +18,6 @@ import click
 import httpx
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
-from sqlalchemy.engine.url import make_url
 
 from .config import API_KEY_HEADER, BACKEND_URL, get_postgres_url
 from .models.connection import Connection
@@ -64,21 +63,59 @@ def configure_logging(quiet: bool = False):
 # No longer needed during startup
 
 
-def get_mcp(urls: tuple[str, ...], api_key: str | None = None, host: str = "127.0.0.1", port: int = 8000, quiet: bool = False) -> FastMCP:
+async def warm_up_pools() -> None:
+    """Open the configured league connection pools ahead of the first tool call."""
+    from .models.connection import get_pool
+    
+    urls = {url for url in (get_postgres_url(league) for league in (None, "mlb", "nba")) if url}
+    connections = [await Connection(url=url).connect() for url in urls]
+    results = await asyncio.gather(
+        *(get_pool(db.connection_string) for db in connections), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Connection pool warmup failed: %s", result)
+
+
+def get_mcp(urls: tuple[str, ...], api_key: str | None = None, host: str = "127.0.0.1", port: int = 8000, quiet: bool = False, transport: str = "stdio") -> FastMCP:
     # Note: Database connections are now handled lazily by individual tools based on league parameter
     # No need to test database connections during startup
     
+    # Stateless HTTP enters the lifespan once per request, so the backend
+    # client is created once and shared by every session
+    backend_client: httpx.AsyncClient | None = None
+    warmup_task: asyncio.Task | None = None
+    
     @asynccontextmanager
     async def app_lifespan(mcp_server: FastMCP) -> AsyncIterator[AppContext]:
         """Manage application lifecycle with type-safe context"""
         # No database connection testing during startup - connections are handled by tools
+        from .models.connection import close_pools
+        from .utils import close_http_client
+        nonlocal backend_client, warmup_task
+        
+        # Warm pools in the background so startup never waits on the database.
+        # Only long-lived HTTP servers reuse them; a stdio spawn opens just
+        # the pools its tool calls actually need.
+        if transport != "stdio" and warmup_task is None:
+            warmup_task = asyncio.create_task(warm_up_pools())
         
-        if api_key:
-            headers = {API_KEY_HEADER: api_key}
-            async with httpx.AsyncClient(headers=headers, base_url=BACKEND_URL) as http_client:
-                yield AppContext(http_session=http_client, url_map={})
-        else:
-            yield AppContext(url_map={})
+        try:
+            if api_key:
+                if backend_client is None or backend_client.is_closed:
+                    headers = {API_KEY_HEADER: api_key}
+                    backend_client = httpx.AsyncClient(headers=headers, base_url=BACKEND_URL)
+                yield AppContext(http_session=backend_client, url_map={})
+            else:
+                yield AppContext(url_map={})
+        finally:
+            # Only a stdio session spans the whole process; HTTP sessions keep
+            # pooled database and HTTP connections alive for the next request
+            if transport == "stdio":
+                if backend_client is not None:
+                    await backend_client.aclose()
+                await close_pools()
+                await close_http_client()
 
     # Use stateless HTTP for production deployment
     mcp = FastMCP("Blitz Agent MCP Server", lifespan=app_lifespan, host=host, port=port, stateless_http=True)
@@ -90,13 +127,33 @@ def get_mcp(urls: tuple[str, ...], api_key: str | None = None, host: str = "127.
     return mcp
 
 
+def run_server(mcp_instance: FastMCP, transport: str):
+    """Run the server on the given transport, using uvloop's event loop when installed"""
+    import anyio
+    
+    runners = {
+        "stdio": mcp_instance.run_stdio_async,
+        "sse": mcp_instance.run_sse_async,
+        "streamable-http": mcp_instance.run_streamable_http_async,
+    }
+    try:
+        import uvloop  # noqa: F401
+        backend_options = {"use_uvloop": True}
+    except ImportError:
+        backend_options = {}
+    
+    # Same as FastMCP.run, but lets anyio build a uvloop loop instead of
+    # swapping the global event loop policy
+    anyio.run(runners[transport], backend_options=backend_options)
+
+
 def run_http_server(mcp_instance: FastMCP, transport: str, host: str = "127.0.0.1", port: int = 8000, quiet: bool = False):
     """Run HTTP server using FastMCP's built-in transport"""
     if not quiet:
         logger.info(f"Starting {transport} server on {host}:{port}")
         logger.info(f"Using FastMCP built-in {transport} transport")
     
-    mcp_instance.run(transport=transport)
+    run_server(mcp_instance, transport)
 
 
 @click.command()
@@ -138,13 +195,13 @@ def main(
         if port is None:
             port = 8000
     
-    mcp_instance = get_mcp(urls, api_key, host, port, quiet=quiet)
+    mcp_instance = get_mcp(urls, api_key, host, port, quiet=quiet, transport=transport)
     
     # Handle different transport modes
     if transport in ("sse", "streamable-http"):
         run_http_server(mcp_instance, transport, host, port, quiet=quiet)
     else:
-        mcp_instance.run(transport=transport)
+        run_server(mcp_instance, transport)
 
 
 if __name__ == "__main__":
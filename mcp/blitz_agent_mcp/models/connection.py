@@ -3,11 +3,12 @@
 import asyncio
 import asyncpg
 import re
+import string
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Optional, List
 from pydantic import BaseModel, Field
-from sqlalchemy.engine.url import make_url
 from urllib.parse import quote_plus
 
 try:
@@ -20,16 +21,55 @@ from .database import MatchMode
 # Query timeout in seconds (default 60 seconds)
 QUERY_TIMEOUT = 60
 
+# Connection pool sizing, shared by every tool call against the same database
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 5
 
-def tokenize(text: str) -> List[str]:
-    """Tokenize text by splitting on common separators and converting to lowercase."""
-    import string
-    # Replace common separators with spaces
-    for char in ['_', '-', '.', ':', ';']:
-        text = text.replace(char, ' ')
-    # Remove punctuation and split
-    text = ''.join(char if char not in string.punctuation else ' ' for char in text)
-    return [token.lower() for token in text.split() if token]
+# Process-wide connection pools keyed by connection string
+_POOLS: Dict[str, asyncpg.Pool] = {}
+
+# Per-database locks so concurrent first calls create a single pool
+_POOL_LOCKS: Dict[str, asyncio.Lock] = {}
+
+
+async def get_pool(connection_string: str) -> asyncpg.Pool:
+    """Return the shared connection pool for a database, creating it on first use."""
+    pool = _POOLS.get(connection_string)
+    if pool is not None:
+        return pool
+    
+    lock = _POOL_LOCKS.setdefault(connection_string, asyncio.Lock())
+    async with lock:
+        pool = _POOLS.get(connection_string)
+        if pool is None:
+            pool = await asyncpg.create_pool(
+                connection_string,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+            )
+            _POOLS[connection_string] = pool
+    return pool
+
+
+async def close_pools() -> None:
+    """Close all shared connection pools."""
+    pools = list(_POOLS.values())
+    _POOLS.clear()
+    for pool in pools:
+        await pool.close()
+
+
+# Separators and punctuation both split tokens
+_TOKEN_SEPARATORS = str.maketrans({char: ' ' for char in string.punctuation})
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> tuple:
+    """Tokenize text by splitting on common separators and converting to lowercase.
+
+    Cached because the same table names are re-tokenized on every search.
+    """
+    return tuple(token.lower() for token in text.translate(_TOKEN_SEPARATORS).split())
 
 
 def jaro_winkler_similarity(s1: str, s2: str) -> float:
@@ -101,6 +141,31 @@ def jaro_winkler_similarity(s1: str, s2: str) -> float:
     return jaro + (0.1 * prefix * (1 - jaro))
 
 
+@lru_cache(maxsize=None)
+def _encode_password_in_url(url: str) -> str:
+    """Ensure password in URL is properly encoded (parsed once per URL)."""
+    # SQLAlchemy is only needed for URL parsing, so load it on first use
+    from sqlalchemy.engine.url import make_url
+    
+    try:
+        parsed_url = make_url(url)
+        if parsed_url.password:
+            # Reconstruct URL with encoded password
+            encoded_password = quote_plus(str(parsed_url.password))
+            new_url = f"{parsed_url.drivername}://{parsed_url.username}:{encoded_password}@{parsed_url.host}"
+            if parsed_url.port:
+                new_url += f":{parsed_url.port}"
+            new_url += f"/{parsed_url.database}"
+            if parsed_url.query:
+                query_string = "&".join([f"{k}={v}" for k, v in parsed_url.query.items()])
+                new_url += f"?{query_string}"
+            return new_url
+        return url
+    except Exception:
+        # If parsing fails, return original URL
+        return url
+
+
 @dataclass
 class ConnectionResult:
     """Result of a connection test."""
@@ -115,23 +180,7 @@ class Connection(BaseModel):
     
     def _encode_password_in_url(self, url: str) -> str:
         """Ensure password in URL is properly encoded."""
-        try:
-            parsed_url = make_url(url)
-            if parsed_url.password:
-                # Reconstruct URL with encoded password
-                encoded_password = quote_plus(str(parsed_url.password))
-                new_url = f"{parsed_url.drivername}://{parsed_url.username}:{encoded_password}@{parsed_url.host}"
-                if parsed_url.port:
-                    new_url += f":{parsed_url.port}"
-                new_url += f"/{parsed_url.database}"
-                if parsed_url.query:
-                    query_string = "&".join([f"{k}={v}" for k, v in parsed_url.query.items()])
-                    new_url += f"?{query_string}"
-                return new_url
-            return url
-        except Exception:
-            # If parsing fails, return original URL
-            return url
+        return _encode_password_in_url(url)
     
     async def connect(self, url_map: Optional[Dict] = None) -> 'DatabaseConnection':
         """Connect to the database and return a connection object."""
@@ -153,6 +202,9 @@ class Connection(BaseModel):
 class DatabaseConnection:
     """Database connection wrapper for query operations."""
     
+    # Created on every tool call; pooled connections live in _POOLS
+    __slots__ = ("connection_string",)
+    
     def __init__(self, connection_string: str):
         self.connection_string = connection_string
     
@@ -168,13 +220,14 @@ class DatabaseConnection:
     
     async def query(self, code: str) -> Dict[str, Any]:
         """Execute a SQL query with timeout."""
-        conn = await asyncpg.connect(self.connection_string)
+        pool = await get_pool(self.connection_string)
         try:
-            # Execute query with timeout
-            results = await asyncio.wait_for(
-                conn.fetch(code), 
-                timeout=QUERY_TIMEOUT
-            )
+            async with pool.acquire() as conn:
+                # Execute query with timeout
+                results = await asyncio.wait_for(
+                    conn.fetch(code), 
+                    timeout=QUERY_TIMEOUT
+                )
             rows = []
             for row in results:
                 row_dict = {}
@@ -192,13 +245,11 @@ class DatabaseConnection:
             }
         except asyncio.TimeoutError:
             raise RuntimeError(f"Query timed out after {QUERY_TIMEOUT} seconds. Please simplify your query or add more specific WHERE conditions to reduce the data being processed.")
-        finally:
-            await conn.close()
     
     async def inspect_table(self, table_path: str) -> Dict[str, Any]:
         """Inspect table structure."""
-        conn = await asyncpg.connect(self.connection_string)
-        try:
+        pool = await get_pool(self.connection_string)
+        async with pool.acquire() as conn:
             # Remove schema prefix if present - just use table name, assume public schema
             if '.' in table_path:
                 table_name = table_path.split('.', 1)[1]
@@ -232,13 +283,11 @@ class DatabaseConnection:
                     for col in columns
                 ]
             }
-        finally:
-            await conn.close()
     
     async def sample_table(self, table_path: str, n: int = 5) -> Dict[str, Any]:
         """Sample data from a table."""
-        conn = await asyncpg.connect(self.connection_string)
-        try:
+        pool = await get_pool(self.connection_string)
+        async with pool.acquire() as conn:
             # Remove schema prefix if present - just use table name
             if '.' in table_path:
                 table_name = table_path.split('.', 1)[1]
@@ -264,13 +313,11 @@ class DatabaseConnection:
                 "data": rows,
                 "columns": list(rows[0].keys()) if rows else []
             }
-        finally:
-            await conn.close()
     
     async def search_tables(self, pattern: str, limit: int = 10, mode: MatchMode = MatchMode.BM25) -> list:
         """Search for tables matching a pattern using various algorithms."""
-        conn = await asyncpg.connect(self.connection_string)
-        try:
+        pool = await get_pool(self.connection_string)
+        async with pool.acquire() as conn:
             # Get all tables in the schema
             tables_query = """
                 SELECT 
@@ -291,22 +338,17 @@ class DatabaseConnection:
             table_names = [table["table_name"] for table in all_tables]
             
             # Use the appropriate search method
-            if mode == MatchMode.REGEX:
-                matched_names = self._search_tables_regex(table_names, pattern, limit)
-            elif mode == MatchMode.JARO_WINKLER:
-                matched_names = self._search_tables_jaro_winkler(table_names, pattern, limit)
-            elif mode == MatchMode.BM25:
-                matched_names = self._search_tables_bm25(table_names, pattern, limit)
-            elif mode == MatchMode.JACCARD:
-                matched_names = self._search_tables_jaccard(table_names, pattern, limit)
-            else:
-                matched_names = []
+            search_method = self._SEARCH_METHODS.get(getattr(mode, "value", mode))
+            matched_names = search_method(self, table_names, pattern, limit) if search_method else []
             
             # Convert back to the expected format
+            tables_by_name = {}
+            for table in all_tables:
+                tables_by_name.setdefault(table["table_name"], table)
             matched_tables = []
             for name in matched_names:
                 # Find the original table info
-                table_info = next((t for t in all_tables if t["table_name"] == name), None)
+                table_info = tables_by_name.get(name)
                 if table_info:
                     matched_tables.append({
                         "table_name": table_info["table_name"],
@@ -315,9 +357,6 @@ class DatabaseConnection:
                     })
             
             return matched_tables
-            
-        finally:
-            await conn.close()
     
     def _search_tables_regex(self, table_names: List[str], pattern: str, limit: int) -> List[str]:
         """Search tables using regex pattern."""
@@ -431,4 +470,12 @@ class DatabaseConnection:
         grams = []
         for i in range(len(text) - n + 1):
             grams.append(text[i:i + n])
-        return grams 
\ No newline at end of file
+        return grams
+
+    # Search method per MatchMode value, looked up once per search
+    _SEARCH_METHODS = {
+        MatchMode.REGEX.value: _search_tables_regex,
+        MatchMode.JARO_WINKLER.value: _search_tables_jaro_winkler,
+        MatchMode.BM25.value: _search_tables_bm25,
+        MatchMode.JACCARD.value: _search_tables_jaccard,
+    }
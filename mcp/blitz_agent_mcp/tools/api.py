@@ -2,9 +2,8 @@
 
 import asyncio
 import logging
-import aiohttp
 import json
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from urllib.parse import urlparse, parse_qs
 
 from httpx import HTTPStatusError
@@ -16,6 +15,9 @@ from ..utils import serialize_response
 
 __all__ = ["get_api_docs", "call_api_endpoint"]
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 async def _get_context_field(field: str, ctx: Context) -> Any:
     """Get the context of the current request."""
@@ -40,6 +42,9 @@ async def get_api_docs(
     if not openapi_url:
         raise ValueError("openapi_url is required")
     
+    # Import aiohttp only when an API tool is actually used
+    import aiohttp
+
     try:
         async with aiohttp.ClientSession() as session:
             return await _discover_api(session, openapi_url)
@@ -78,6 +83,8 @@ async def call_api_endpoint(
     if not method:
         raise ValueError("method is required")
     
+    import aiohttp
+
     try:
         async with aiohttp.ClientSession() as session:
             return await _call_api(session, openapi_url, endpoint, method, parameters or {})
@@ -124,7 +131,7 @@ def _detect_api_type_and_base_url(openapi_url: str, spec: Dict[str, Any]) -> tup
     return "unknown", ""
 
 
-async def _discover_api(session: aiohttp.ClientSession, openapi_url: str) -> Dict[str, Any]:
+async def _discover_api(session: "aiohttp.ClientSession", openapi_url: str) -> Dict[str, Any]:
     """Discover OpenAPI endpoints."""
     async with session.get(openapi_url) as response:
         if response.status != 200:
@@ -179,8 +186,10 @@ async def _discover_api(session: aiohttp.ClientSession, openapi_url: str) -> Dic
         }
 
 
-async def _call_api(session: aiohttp.ClientSession, openapi_url: str, endpoint: str, method: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+async def _call_api(session: "aiohttp.ClientSession", openapi_url: str, endpoint: str, method: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
     """Call an API endpoint."""
+    import aiohttp
+
     # First get the OpenAPI spec to determine the base URL
     async with session.get(openapi_url) as response:
         if response.status != 200:
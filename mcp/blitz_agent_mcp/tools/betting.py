@@ -9,7 +9,7 @@ import httpx
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
-from ..utils import serialize_response
+from ..utils import get_http_client, serialize_response
 
 __all__ = ["get_betting_events_by_date", "get_betting_markets_for_event"]
 
@@ -57,47 +57,47 @@ async def get_betting_events_by_date(
     logger.info(f"Fetching betting events for date: {date}")
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Strip out the massive BettingMarkets arrays to reduce response size
-            # Only keep essential event information for the first call
-            simplified_events = []
-            if isinstance(data, list):
-                for event in data:
-                    simplified_event = {
-                        "BettingEventID": event.get("BettingEventID"),
-                        "Name": event.get("Name"),
-                        "GameID": event.get("GameID"),
-                        "StartDate": event.get("StartDate"),
-                        "GameStartTime": event.get("GameStartTime"),
-                        "AwayTeam": event.get("AwayTeam"),
-                        "HomeTeam": event.get("HomeTeam"),
-                        "AwayTeamID": event.get("AwayTeamID"),
-                        "HomeTeamID": event.get("HomeTeamID"),
-                        "GameStatus": event.get("GameStatus"),
-                        "AwayTeamScore": event.get("AwayTeamScore"),
-                        "HomeTeamScore": event.get("HomeTeamScore"),
-                        # Include count of available betting markets but not the full data
-                        "BettingMarketsCount": len(event.get("BettingMarkets", []))
-                    }
-                    simplified_events.append(simplified_event)
-            
-            # Add metadata to response
-            result = {
-                "date": date,
-                "events_count": len(simplified_events),
-                "events": simplified_events,
-                "api_endpoint": f"{url}?key={key}",
-                "note": "Use get_betting_markets_for_event() with BettingEventID to get detailed odds and markets for specific games"
-            }
-            
-            logger.info(f"Successfully fetched {result['events_count']} betting events for {date}")
-            return serialize_response(result)
-            
+        client = get_http_client()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        # Strip out the massive BettingMarkets arrays to reduce response size
+        # Only keep essential event information for the first call
+        simplified_events = []
+        if isinstance(data, list):
+            for event in data:
+                simplified_event = {
+                    "BettingEventID": event.get("BettingEventID"),
+                    "Name": event.get("Name"),
+                    "GameID": event.get("GameID"),
+                    "StartDate": event.get("StartDate"),
+                    "GameStartTime": event.get("GameStartTime"),
+                    "AwayTeam": event.get("AwayTeam"),
+                    "HomeTeam": event.get("HomeTeam"),
+                    "AwayTeamID": event.get("AwayTeamID"),
+                    "HomeTeamID": event.get("HomeTeamID"),
+                    "GameStatus": event.get("GameStatus"),
+                    "AwayTeamScore": event.get("AwayTeamScore"),
+                    "HomeTeamScore": event.get("HomeTeamScore"),
+                    # Include count of available betting markets but not the full data
+                    "BettingMarketsCount": len(event.get("BettingMarkets", []))
+                }
+                simplified_events.append(simplified_event)
+        
+        # Add metadata to response
+        result = {
+            "date": date,
+            "events_count": len(simplified_events),
+            "events": simplified_events,
+            "api_endpoint": f"{url}?key={key}",
+            "note": "Use get_betting_markets_for_event() with BettingEventID to get detailed odds and markets for specific games"
+        }
+        
+        logger.info(f"Successfully fetched {result['events_count']} betting events for {date}")
+        return serialize_response(result)
+        
     except httpx.HTTPStatusError as e:
         error_msg = f"HTTP error {e.response.status_code} when fetching betting events for {date}: {e.response.text}"
         logger.error(error_msg)
@@ -179,56 +179,56 @@ async def get_betting_markets_for_event(
     logger.info(f"Fetching betting markets for event ID: {event_id}")
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Apply filters to reduce response size and focus on relevant markets
-            filtered_markets = []
-            if isinstance(data, list):
-                for market in data:
-                    # Filter by betting period type ID
-                    if market.get("BettingPeriodTypeID") != betting_period_type_id:
+        client = get_http_client()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        # Apply filters to reduce response size and focus on relevant markets
+        filtered_markets = []
+        if isinstance(data, list):
+            for market in data:
+                # Filter by betting period type ID
+                if market.get("BettingPeriodTypeID") != betting_period_type_id:
+                    continue
+                
+                # Filter by market type if specified
+                if market_type_filter and market.get("BettingMarketType") != market_type_filter:
+                    continue
+                
+                # Filter by bet type if specified
+                if bet_type_filter and market.get("BettingBetType") != bet_type_filter:
+                    continue
+                
+                # Filter by player name if specified
+                if player_name_filter and market.get("PlayerName"):
+                    if player_name_filter.lower() not in market.get("PlayerName", "").lower():
                         continue
-                    
-                    # Filter by market type if specified
-                    if market_type_filter and market.get("BettingMarketType") != market_type_filter:
-                        continue
-                    
-                    # Filter by bet type if specified
-                    if bet_type_filter and market.get("BettingBetType") != bet_type_filter:
-                        continue
-                    
-                    # Filter by player name if specified
-                    if player_name_filter and market.get("PlayerName"):
-                        if player_name_filter.lower() not in market.get("PlayerName", "").lower():
-                            continue
-                    
-                    filtered_markets.append(market)
-            
-            # Add metadata to response
-            filters_applied = {
-                "betting_period_type_id": betting_period_type_id,
-                "market_type_filter": market_type_filter,
-                "bet_type_filter": bet_type_filter,
-                "player_name_filter": player_name_filter
-            }
-            
-            result = {
-                "event_id": event_id,
-                "include_available_only": True,
-                "total_markets_from_api": len(data) if isinstance(data, list) else 0,
-                "filtered_markets_count": len(filtered_markets),
-                "filters_applied": filters_applied,
-                "markets": filtered_markets,
-                "api_endpoint": f"{url}?" + "&".join([f"{k}={v}" for k, v in params.items()])
-            }
-            
-            logger.info(f"Successfully fetched and filtered {result['filtered_markets_count']} betting markets (from {result['total_markets_from_api']} total) for event {event_id}")
-            return serialize_response(result)
-            
+                
+                filtered_markets.append(market)
+        
+        # Add metadata to response
+        filters_applied = {
+            "betting_period_type_id": betting_period_type_id,
+            "market_type_filter": market_type_filter,
+            "bet_type_filter": bet_type_filter,
+            "player_name_filter": player_name_filter
+        }
+        
+        result = {
+            "event_id": event_id,
+            "include_available_only": True,
+            "total_markets_from_api": len(data) if isinstance(data, list) else 0,
+            "filtered_markets_count": len(filtered_markets),
+            "filters_applied": filters_applied,
+            "markets": filtered_markets,
+            "api_endpoint": f"{url}?" + "&".join([f"{k}={v}" for k, v in params.items()])
+        }
+        
+        logger.info(f"Successfully fetched and filtered {result['filtered_markets_count']} betting markets (from {result['total_markets_from_api']} total) for event {event_id}")
+        return serialize_response(result)
+        
     except httpx.HTTPStatusError as e:
         error_msg = f"HTTP error {e.response.status_code} when fetching betting markets for event {event_id}: {e.response.text}"
         logger.error(error_msg)
@@ -2,24 +2,53 @@
 
 import asyncio
 import logging
-import os
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 from httpx import HTTPStatusError
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
-from ..config import MAX_DATA_ROWS
+from ..config import MAX_DATA_ROWS, SCHEMAS_DIR
 from ..utils import serialize_response
 
 __all__ = ["get_database_documentation"]
 
+# Leagues with bundled schema documentation
+_SCHEMA_LEAGUES = frozenset({"mlb", "nba"})
+
 
 async def _get_context_field(field: str, ctx: Context) -> Any:
     """Get the context of the current request."""
     return getattr(getattr(getattr(ctx, "request_context", None), "lifespan_context", None), field, None)
 
 
+@lru_cache(maxsize=None)
+def _load_schema_documentation(league: str) -> str:
+    """Read and cache the bundled schema documentation for a league.
+
+    Callers pass a lowercased league from _SCHEMA_LEAGUES, so the cache stays
+    bounded; a failed read raises and is not cached.
+    """
+    schema_file_path = SCHEMAS_DIR / f"{league}-schema.md"
+    
+    with open(schema_file_path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+
+def load_schema_documentation(league: Optional[str]) -> Optional[str]:
+    """Get the bundled schema documentation for a league, or None if it has none.
+
+    Raises OSError if the schema file cannot be read.
+    """
+    if not league:
+        return None
+    league = league.lower()
+    if league not in _SCHEMA_LEAGUES:
+        return None
+    return _load_schema_documentation(league)
+
+
 async def get_database_documentation(
     ctx: Context,
     league: str = Field(..., description="League name (e.g. 'mlb', 'nba')")
@@ -43,24 +72,20 @@ async def get_database_documentation(
     
     league = league.lower()
     
-    if league not in ["mlb", "nba"]:
+    if league not in _SCHEMA_LEAGUES:
         return {
             "success": False,
             "error": f"Unsupported league: {league}. Supported leagues: mlb, nba"
         }
     
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        schema_file_path = os.path.join(current_dir, "..", "schemas", f"{league}-schema.md")
-        
-        with open(schema_file_path, 'r', encoding='utf-8') as file:
-            schema_content = file.read()
+        schema_content = _load_schema_documentation(league)
         
         return {
             "success": True,
             "league": league.upper(),
             "schema_documentation": schema_content,
-            "source": "file" if os.path.exists(schema_file_path) else "inline"
+            "source": "file"
         }
         
     except Exception as e:
@@ -49,14 +49,16 @@ async def modify_question(
     actionable queries by applying assumptions and clarifications.
     """
     logger = logging.getLogger("blitz-agent-mcp")
-    logger.info("=== MODIFY QUESTION DEBUG ===")
-    logger.info(f"Original question: {original_question}")
-    logger.info(f"Assumptions: {assumptions}")
-    logger.info(f"Modification type: {modification_type}")
-    logger.info(f"Context: {context}")
-    logger.info(f"Limit results: {limit_results}")
-    logger.info(f"Include examples: {include_examples}")
-    logger.info(f"Clarify terms: {clarify_terms}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("=== MODIFY QUESTION DEBUG ===")
+        logger.debug(f"Original question: {original_question}")
+        logger.debug(f"Assumptions: {assumptions}")
+        logger.debug(f"Modification type: {modification_type}")
+        logger.debug(f"Context: {context}")
+        logger.debug(f"Limit results: {limit_results}")
+        logger.debug(f"Include examples: {include_examples}")
+        logger.debug(f"Clarify terms: {clarify_terms}")
     
     try:
         # Start with the original question
@@ -92,8 +94,9 @@ async def modify_question(
             "transformation_summary": _generate_transformation_summary(original_question, modified_question, assumptions, limit_results, include_examples)
         }
         
-        logger.info(f"Modified question: {modified_question}")
-        logger.info(f"Transformation summary: {result['transformation_summary']}")
+        if debug_enabled:
+            logger.debug(f"Modified question: {modified_question}")
+            logger.debug(f"Transformation summary: {result['transformation_summary']}")
         
         return result
         
@@ -54,7 +54,7 @@ async def query(
                 raise ConnectionError(f"No connection provided and PostgreSQL configuration{league_info} is incomplete. Please provide a connection or configure PostgreSQL settings.")
             query_obj.connection = Connection(url=postgres_url)
             if league:
-                logger.debug(f"Using configured PostgreSQL connection for league: {league}")
+                logger.debug("Using configured PostgreSQL connection for league: %s", league)
             else:
                 logger.debug("Using configured PostgreSQL connection (default)")
         
@@ -1,16 +1,13 @@
 import asyncio
 import logging
 import json
+from functools import lru_cache
 from typing import Any, List, Optional
 
 from httpx import HTTPStatusError
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
-# Azure AI Search imports
-from azure.search.documents import SearchClient
-from azure.core.credentials import AzureKeyCredential
-
 from ..config import AZURE_SEARCH_ENDPOINT, AZURE_SEARCH_KEY
 from ..utils import get_azure_chat_client, serialize_response
 
@@ -18,12 +15,54 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["recall_similar_db_queries"]
 
+# Ranking prompts, kept less restrictive and more inclusive
+_RANK_SYSTEM_PROMPT_TEMPLATE = """You are an expert on {league} and PostgreSQL. Your job is to identify which questions from the search results are similar to the user's question in terms of meaning, intent, or would require similar data/analysis.
+
+Be inclusive - if a question involves similar players, statistics, timeframes, or analytical approaches, it's likely relevant. For sports queries, questions about the same players or similar statistical analysis should generally be considered relevant.
+
+Return a JSON object with a single key 'documentIds' containing a list of the relevant document IDs in order of relevance (most relevant first)."""
+
+_RANK_HUMAN_PROMPT_TEMPLATE = """USER QUESTION:
+{query_text}
+
+SEARCH RESULTS:
+{search_results}
+
+Return document IDs for questions that are similar or would help answer the user's question. Be generous in your relevance assessment - if there's any connection in terms of players, statistics, or analytical approach, include it."""
+
 
 async def _get_context_field(field: str, ctx: Context) -> Any:
     """Get the context of the current request."""
     return getattr(getattr(getattr(ctx, "request_context", None), "lifespan_context", None), field, None)
 
 
+@lru_cache(maxsize=None)
+def _get_search_client(endpoint: str, index_name: str, api_key: str):
+    """Get a shared Azure AI Search client for an index (created once per process)."""
+    # Import the Azure AI Search SDK only when the tool is actually used
+    from azure.search.documents import SearchClient
+    from azure.core.credentials import AzureKeyCredential
+
+    return SearchClient(
+        endpoint=endpoint,
+        index_name=index_name,
+        credential=AzureKeyCredential(api_key)
+    )
+
+
+def _hybrid_search(search_client, query_text: str) -> List[Any]:
+    """Run the hybrid search and drain its result pager (blocking)."""
+    results = search_client.search(
+        query_text,
+        select=["id", "UserPrompt", "Query"],
+        search_mode='any',
+        query_type='semantic',
+        semantic_configuration_name='my-semantic-config',
+        top=20
+    )
+    return list(results)
+
+
 async def rank_search_results(query_text: str, search_results: List[Any], league: str) -> List[Any]:
     """Rank search results using GPT-4o-mini via Azure OpenAI."""
     try:
@@ -43,27 +82,20 @@ async def rank_search_results(query_text: str, search_results: List[Any], league
 
         chat_client = get_azure_chat_client()
         
-        # Updated prompt to be less restrictive and more inclusive
-        system_prompt = f"""You are an expert on {league.upper()} and PostgreSQL. Your job is to identify which questions from the search results are similar to the user's question in terms of meaning, intent, or would require similar data/analysis.
-
-Be inclusive - if a question involves similar players, statistics, timeframes, or analytical approaches, it's likely relevant. For sports queries, questions about the same players or similar statistical analysis should generally be considered relevant.
-
-Return a JSON object with a single key 'documentIds' containing a list of the relevant document IDs in order of relevance (most relevant first)."""
-        
-        human_prompt = f"""USER QUESTION:
-{query_text}
-
-SEARCH RESULTS:
-{json.dumps(formatted_results, indent=2)}
-
-Return document IDs for questions that are similar or would help answer the user's question. Be generous in your relevance assessment - if there's any connection in terms of players, statistics, or analytical approach, include it."""
+        system_prompt = _RANK_SYSTEM_PROMPT_TEMPLATE.format(league=league.upper())
+        human_prompt = _RANK_HUMAN_PROMPT_TEMPLATE.format(
+            query_text=query_text,
+            search_results=json.dumps(formatted_results, indent=2),
+        )
 
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": human_prompt},
         ]
 
-        response = chat_client.chat.completions.create(
+        # The OpenAI client is synchronous; keep the rerank call off the event loop
+        response = await asyncio.to_thread(
+            chat_client.chat.completions.create,
             model="gpt-4o-mini",
             messages=messages,
             response_format={"type": "json_object"},
@@ -133,29 +165,12 @@ async def recall_similar_db_queries(
                 "fallback_suggestion": "You can continue without historical context, but recall_similar_db_queries from previous queries will not be available."
             }
 
-        # Create SearchClient
-        search_client = SearchClient(
-            endpoint=endpoint,
-            index_name=index_name,
-            credential=AzureKeyCredential(api_key)
-        )
+        search_client = _get_search_client(endpoint, index_name, api_key)
         
         logger.info(f"Performing hybrid search on index: {index_name}...")
         
-        # Perform hybrid search
-        results = search_client.search(
-            query_description,
-            select=["id", "UserPrompt", "Query"],
-            search_mode='any',
-            query_type='semantic',
-            semantic_configuration_name='my-semantic-config',
-            top=20
-        )
-        
-        # Collect results for processing
-        collected_results = []
-        for result in results:
-            collected_results.append(result)
+        # Perform hybrid search off the event loop; the SDK client is synchronous
+        collected_results = await asyncio.to_thread(_hybrid_search, search_client, query_description)
         
         logger.info(f"Azure Search returned {len(collected_results)} results")
         
@@ -168,8 +183,9 @@ async def recall_similar_db_queries(
             }
         
         # Log some details about the search results for debugging
-        for i, result in enumerate(collected_results[:3]):  # Log first 3 results
-            logger.info(f"Search result {i+1}: ID={result.get('id', 'N/A')}, Score={getattr(result, '@search.score', 'N/A')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, result in enumerate(collected_results[:3]):  # Log first 3 results
+                logger.debug(f"Search result {i+1}: ID={result.get('id', 'N/A')}, Score={getattr(result, '@search.score', 'N/A')}")
         
         # Rank the results using GPT-4o-mini
         logger.info("Ranking search results with GPT-4o-mini...")
@@ -48,7 +48,7 @@ async def sample(
         
         table_obj = Table(table_name=table, connection=Connection(url=postgres_url))
         if league:
-            logger.debug(f"Using configured PostgreSQL connection for league: {league}")
+            logger.debug("Using configured PostgreSQL connection for league: %s", league)
         else:
             logger.debug("Using configured PostgreSQL connection (default)")
         
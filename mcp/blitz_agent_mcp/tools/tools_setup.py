@@ -4,6 +4,7 @@ Tools setup module - defines all MCP tools with proper decorators
 
 import asyncio
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP, Context
@@ -15,6 +16,33 @@ from ..models.connection import Connection
 from ..utils import serialize_response
 
 
+@lru_cache(maxsize=None)
+def _shared_connection(postgres_url: str) -> Connection:
+    """Return the Connection for a database URL, built once and shared by every tool call."""
+    return Connection(url=postgres_url)
+
+
+def _league_connection(league: Optional[str], log_action: Optional[str] = "Using", table_fallback: bool = False) -> Connection:
+    """Get the Connection to the configured PostgreSQL database for a league.
+
+    log_action is the verb for the debug log ("Using", "Testing"), or None for no log.
+    table_fallback selects the error text for tools whose table had no connection of its own.
+    """
+    postgres_url = get_postgres_url(league)
+    if not postgres_url:
+        league_info = f" for league '{league}'" if league else ""
+        if table_fallback:
+            raise ConnectionError(f"No connection provided and PostgreSQL configuration{league_info} is incomplete. Please provide a connection or configure PostgreSQL settings.")
+        raise ConnectionError(f"PostgreSQL configuration{league_info} is incomplete. Please configure PostgreSQL settings.")
+    
+    if log_action:
+        logger = logging.getLogger("blitz-agent-mcp")
+        if league:
+            logger.debug("%s configured PostgreSQL connection for league: %s", log_action, league)
+        else:
+            logger.debug("%s configured PostgreSQL connection (default)", log_action)
+    return _shared_connection(postgres_url)
+
 
 def setup_tools(mcp: FastMCP):
     """Set up all MCP tools with proper decorators"""
@@ -35,23 +63,13 @@ def setup_tools(mcp: FastMCP):
         4. Simply provide the table name as a string (e.g., "pitchingstatsgame", "battingstatsgame")
         5. Specify the league parameter to inspect tables in the appropriate database (mlb, nba, etc.)
         """
-        logger = logging.getLogger("blitz-agent-mcp")
-        
         try:
             # Create Table object from string input
             table_obj = Table(table_name=table)
             
             # If no connection provided in the table, use the configured PostgreSQL URL for the specified league
             if table_obj.connection is None:
-                postgres_url = get_postgres_url(league)
-                if not postgres_url:
-                    league_info = f" for league '{league}'" if league else ""
-                    raise ConnectionError(f"No connection provided and PostgreSQL configuration{league_info} is incomplete. Please provide a connection or configure PostgreSQL settings.")
-                table_obj.connection = Connection(url=postgres_url)
-                if league:
-                    logger.debug(f"Using configured PostgreSQL connection for league: {league}")
-                else:
-                    logger.debug("Using configured PostgreSQL connection (default)")
+                table_obj.connection = _league_connection(league, table_fallback=True)
             
             db = await table_obj.connection.connect()
             return serialize_response(await db.inspect_table(table_obj.table_name))
@@ -74,23 +92,13 @@ def setup_tools(mcp: FastMCP):
         3. This helps you understand what the actual data looks like before writing complex queries
         4. Specify the league parameter to sample from the appropriate database (mlb, nba, etc.)
         """
-        logger = logging.getLogger("blitz-agent-mcp")
-        
         try:
             # Create Table object from string input
             table_obj = Table(table_name=table)
             
             # If no connection provided, use the configured PostgreSQL URL for the specified league
             if table_obj.connection is None:
-                postgres_url = get_postgres_url(league)
-                if not postgres_url:
-                    league_info = f" for league '{league}'" if league else ""
-                    raise ConnectionError(f"No connection provided and PostgreSQL configuration{league_info} is incomplete. Please provide a connection or configure PostgreSQL settings.")
-                table_obj.connection = Connection(url=postgres_url)
-                if league:
-                    logger.debug(f"Using configured PostgreSQL connection for league: {league}")
-                else:
-                    logger.debug("Using configured PostgreSQL connection (default)")
+                table_obj.connection = _league_connection(league, table_fallback=True)
             
             db = await table_obj.connection.connect()
             return serialize_response(await db.sample_table(table_obj.table_name, limit))
@@ -113,21 +121,9 @@ def setup_tools(mcp: FastMCP):
         4. Consider using LIMIT to prevent large result sets
         5. Specify the league parameter to query the appropriate database (mlb, nba, etc.)
         """
-        logger = logging.getLogger("blitz-agent-mcp")
-        
         try:
             # Use the configured PostgreSQL URL for the specified league
-            postgres_url = get_postgres_url(league)
-            if not postgres_url:
-                league_info = f" for league '{league}'" if league else ""
-                raise ConnectionError(f"PostgreSQL configuration{league_info} is incomplete. Please configure PostgreSQL settings.")
-            
-            connection = Connection(url=postgres_url)
-            if league:
-                logger.debug(f"Using configured PostgreSQL connection for league: {league}")
-            else:
-                logger.debug("Using configured PostgreSQL connection (default)")
-            
+            connection = _league_connection(league)
             db = await connection.connect()
             return serialize_response(await db.query(sql))
         except Exception as e:
@@ -150,7 +146,6 @@ def setup_tools(mcp: FastMCP):
         4. Specify the league parameter to search in the appropriate database (mlb, nba, etc.)
         """
         from . import search_tables as search_tables_module
-        from ..models.connection import Connection
         
         try:
             # Handle database connection based on league
@@ -158,7 +153,7 @@ def setup_tools(mcp: FastMCP):
             if league:
                 postgres_url = get_postgres_url(league)
                 if postgres_url:
-                    connection = Connection(url=postgres_url)
+                    connection = _shared_connection(postgres_url)
             
             # Call the original search_tables function with correct parameters
             # Original function expects: pattern, mode, limit, connection, league
@@ -188,20 +183,8 @@ def setup_tools(mcp: FastMCP):
         2. This is useful for troubleshooting connection issues
         3. Specify the league parameter to test the appropriate database connection (mlb, nba, etc.)
         """
-        logger = logging.getLogger("blitz-agent-mcp")
-        
         try:
-            postgres_url = get_postgres_url(league)
-            if not postgres_url:
-                league_info = f" for league '{league}'" if league else ""
-                raise ConnectionError(f"PostgreSQL configuration{league_info} is incomplete. Please configure PostgreSQL settings.")
-            
-            connection = Connection(url=postgres_url)
-            if league:
-                logger.debug(f"Testing configured PostgreSQL connection for league: {league}")
-            else:
-                logger.debug("Testing configured PostgreSQL connection (default)")
-            
+            connection = _league_connection(league, log_action="Testing")
             result = await connection.test_connection()
             # Convert ConnectionResult to dictionary
             return {
@@ -343,16 +326,9 @@ def setup_tools(mcp: FastMCP):
         """
         Validate a SQL query without executing it.
         """
-        logger = logging.getLogger("blitz-agent-mcp")
-        
         try:
             # Basic SQL syntax validation using PostgreSQL connection
-            postgres_url = get_postgres_url(league)
-            if not postgres_url:
-                league_info = f" for league '{league}'" if league else ""
-                raise ConnectionError(f"PostgreSQL configuration{league_info} is incomplete. Please configure PostgreSQL settings.")
-            
-            connection = Connection(url=postgres_url)
+            connection = _league_connection(league, log_action=None)
             db = await connection.connect()
             
             # Use EXPLAIN to validate syntax without executing
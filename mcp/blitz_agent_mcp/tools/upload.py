@@ -2,8 +2,8 @@ import asyncio
 import logging
 import secrets
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, List
-from azure.cosmos import CosmosClient, exceptions
 from datetime import datetime
 
 import httpx
@@ -16,6 +16,16 @@ from ..utils import serialize_response
 
 __all__ = ["upload"]
 
+logger = logging.getLogger("blitz-agent-mcp")
+
+
+@lru_cache(maxsize=1)
+def _get_sports_database():
+    """Get the shared Cosmos DB 'sports' database client (created once per process)."""
+    from azure.cosmos import CosmosClient
+    client = CosmosClient(COSMOS_DB_ENDPOINT, COSMOS_DB_KEY)
+    return client.get_database_client('sports')
+
 
 async def _get_context_field(field: str, ctx: Context) -> Any:
     """Get the context of the current request."""
@@ -53,7 +63,8 @@ async def upload(
     if not query:
         raise ValueError("query is required")
     
-    logger = logging.getLogger("blitz-agent-mcp")
+    # Imported on first upload so server startup doesn't load the Cosmos SDK
+    from azure.cosmos import exceptions
     
     try:
         endpoint = COSMOS_DB_ENDPOINT
@@ -66,19 +77,12 @@ async def upload(
                 "message": "COSMOS_DB_ENDPOINT and COSMOS_DB_KEY environment variables must be set"
             }
         
-        client = CosmosClient(endpoint, key)
-        database = client.get_database_client('sports')
+        database = _get_sports_database()
         
         # Determine container based on league
         if league:
             league = league.lower()
-            if league == "mlb":
-                container_name = "mlb-unofficial"
-            elif league == "nba":
-                container_name = "nba-unofficial"
-            else:
-                # For unknown leagues, use a generic container
-                container_name = f"{league}-unofficial"
+            container_name = f"{league}-unofficial"
         else:
             # Fallback to original container when no league specified
             container_name = "agent-learning"
@@ -97,8 +101,8 @@ async def upload(
             'QueryVector': None
         }
         
-        # Upload to Cosmos DB
-        response = container.create_item(query_record)
+        # Upload to Cosmos DB; the SDK client is synchronous, so write off the event loop
+        response = await asyncio.to_thread(container.create_item, query_record)
         
         return {
             "success": True,
@@ -6,7 +6,6 @@ import json
 import os
 from typing import Any, Optional, Union, List, Dict
 from datetime import datetime
-from pathlib import Path
 
 import httpx
 from httpx import HTTPStatusError
@@ -14,11 +13,61 @@ from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from ..config import MAX_DATA_ROWS, AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_API_VERSION
-from ..utils import get_azure_chat_client, serialize_response
+from ..utils import get_azure_chat_client, get_http_client, serialize_response
+from .db_docs import load_schema_documentation
 
 __all__ = ["validate_results"]
 
 
+_VALIDATION_PROMPT_TEMPLATE = """
+You are an expert database analyst specializing in sports data validation. Please analyze the following SQL query execution and its results to determine if they properly answer the user's question.
+
+{schema_context}
+
+ORIGINAL USER QUESTION:
+{user_question}
+
+SQL QUERY EXECUTED:
+{query}
+
+QUERY DESCRIPTION:
+{description}
+
+ACTUAL QUERY RESULTS:
+{results_str}
+
+ADDITIONAL CONTEXT:
+{context}
+
+Please provide a comprehensive validation analysis covering:
+
+1. **Result Correctness**: Do the results make logical sense for the query?
+2. **Data Completeness**: Are there missing or unexpected data points?
+3. **Query Appropriateness**: Does the SQL query properly address the user's question?
+4. **Sports Logic Validation**: Do the results align with expected sports statistics and rules?
+5. **Potential Issues**: Any red flags, anomalies, or concerns?
+6. **Recommendations**: Suggestions for improvement if needed
+
+Focus particularly on:
+- If question is about league-wide stats, ensure no arbitrary LIMIT or ORDER BY is preventing complete results
+- Verify date ranges and filters make sense for the sport's calendar
+- Check if player/team names are correctly matched
+- Validate statistical ranges are realistic for the sport
+- Ensure aggregations and calculations are appropriate
+
+Provide your analysis as a structured JSON response with the following format:
+{{
+    "validation_score": <float between 0.0 and 1.0>,
+    "is_correct": <boolean>,
+    "confidence": <float between 0.0 and 1.0>,
+    "issues_found": [<list of issues>],
+    "insights": [<list of insights>],
+    "recommendations": [<list of recommendations>],
+    "summary": "<brief overall assessment>"
+}}
+"""
+
+
 async def _get_context_field(field: str, ctx: Context) -> Any:
     """Get the context of the current request."""
     return getattr(getattr(getattr(ctx, "request_context", None), "lifespan_context", None), field, None)
@@ -28,40 +77,22 @@ def _read_schema_file(league: str) -> Optional[str]:
     """
     Read the schema file for the specified league.
     
+    Uses the db_docs loader, which caches each supported league's schema
+    after the first successful read.
+    
     Args:
         league: The league name (e.g., 'mlb', 'nba')
         
     Returns:
         The content of the schema file, or None if not found
     """
-    if not league:
-        return None
-        
-    # Normalize league name to lowercase
-    league = league.lower()
-    
-    # Map league names to schema file names
-    schema_files = {
-        'mlb': 'mlb-schema.md',
-        'nba': 'nba-schema.md'
-    }
-    
-    if league not in schema_files:
-        return None
-    
-    # Get the path to the schema file
-    current_dir = Path(__file__).parent.parent
-    schema_path = current_dir / "schemas" / schema_files[league]
-    
     try:
-        if schema_path.exists():
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        else:
-            logging.warning(f"Schema file not found: {schema_path}")
-            return None
+        return load_schema_documentation(league)
+    except FileNotFoundError:
+        logging.warning(f"Schema file not found for league: {league}")
+        return None
     except Exception as e:
-        logging.error(f"Error reading schema file {schema_path}: {e}")
+        logging.error(f"Error reading schema file for league {league}: {e}")
         return None
 
 
@@ -113,107 +144,56 @@ DATABASE SCHEMA DOCUMENTATION ({league.upper()}):
         else:
             results_str = results
         
-        validation_prompt = f"""
-You are an expert database analyst specializing in sports data validation. Please analyze the following SQL query execution and its results to determine if they properly answer the user's question.
-
-{schema_context}
-
-ORIGINAL USER QUESTION:
-{user_question}
-
-SQL QUERY EXECUTED:
-{query}
-
-QUERY DESCRIPTION:
-{description}
-
-ACTUAL QUERY RESULTS:
-{results_str}
-
-ADDITIONAL CONTEXT:
-{context}
-
-Please provide a comprehensive validation analysis covering:
-
-1. **Result Correctness**: Do the results make logical sense for the query?
-2. **Data Completeness**: Are there missing or unexpected data points?
-3. **Query Appropriateness**: Does the SQL query properly address the user's question?
-4. **Sports Logic Validation**: Do the results align with expected sports statistics and rules?
-5. **Potential Issues**: Any red flags, anomalies, or concerns?
-6. **Recommendations**: Suggestions for improvement if needed
-
-Focus particularly on:
-- If question is about league-wide stats, ensure no arbitrary LIMIT or ORDER BY is preventing complete results
-- Verify date ranges and filters make sense for the sport's calendar
-- Check if player/team names are correctly matched
-- Validate statistical ranges are realistic for the sport
-- Ensure aggregations and calculations are appropriate
-
-Provide your analysis as a structured JSON response with the following format:
-{{
-    "validation_score": <float between 0.0 and 1.0>,
-    "is_correct": <boolean>,
-    "confidence": <float between 0.0 and 1.0>,
-    "issues_found": [<list of issues>],
-    "insights": [<list of insights>],
-    "recommendations": [<list of recommendations>],
-    "summary": "<brief overall assessment>"
-}}
-"""
+        validation_prompt = _VALIDATION_PROMPT_TEMPLATE.format(
+            schema_context=schema_context,
+            user_question=user_question,
+            query=query,
+            description=description,
+            results_str=results_str,
+            context=context,
+        )
         
         # Make the API call to Azure OpenAI
-        azure_client = httpx.AsyncClient()
+        azure_client = get_http_client()
+        response = await azure_client.post(
+            f"{AZURE_OPENAI_ENDPOINT}/openai/deployments/gpt-4o-mini/chat/completions?api-version={AZURE_OPENAI_API_VERSION}",
+            headers={
+                "api-key": AZURE_OPENAI_API_KEY,
+                "Content-Type": "application/json"
+            },
+            json={
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": validation_prompt
+                    }
+                ],
+                "max_tokens": 4000,
+                "temperature": 0.1
+            },
+            timeout=30.0
+        )
+        response.raise_for_status()
+        ai_response = response.json()
+        
+        # Extract the validation analysis
+        validation_text = ai_response["choices"][0]["message"]["content"]
+        
+        # Try to parse as JSON
         try:
-            response = await azure_client.post(
-                f"{AZURE_OPENAI_ENDPOINT}/openai/deployments/gpt-4o-mini/chat/completions?api-version={AZURE_OPENAI_API_VERSION}",
-                headers={
-                    "api-key": AZURE_OPENAI_API_KEY,
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": validation_prompt
-                        }
-                    ],
-                    "max_tokens": 4000,
-                    "temperature": 0.1
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
-            ai_response = response.json()
+            validation_result = json.loads(validation_text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            logger.error(f"Raw response: {validation_text}")
             
-            # Extract the validation analysis
-            validation_text = ai_response["choices"][0]["message"]["content"]
-            
-            # Try to parse as JSON
-            try:
-                validation_result = json.loads(validation_text)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                logger.error(f"Raw response: {validation_text}")
-                
-                # Try to extract JSON from the response if it's wrapped in markdown
-                if "```json" in validation_text and "```" in validation_text:
-                    try:
-                        json_start = validation_text.find("```json") + 7
-                        json_end = validation_text.find("```", json_start)
-                        json_content = validation_text[json_start:json_end].strip()
-                        validation_result = json.loads(json_content)
-                    except (json.JSONDecodeError, ValueError):
-                        validation_result = {
-                            "validation_score": 0.5,
-                            "is_correct": None,
-                            "confidence": 0.3,
-                            "issues_found": ["Unable to parse AI validation response as JSON"],
-                            "insights": [],
-                            "recommendations": ["Manual review recommended"],
-                            "summary": validation_text[:1000] + "..." if len(validation_text) > 1000 else validation_text
-                        }
-                else:
-                    # If not valid JSON, create a structured response
+            # Try to extract JSON from the response if it's wrapped in markdown
+            if "```json" in validation_text and "```" in validation_text:
+                try:
+                    json_start = validation_text.find("```json") + 7
+                    json_end = validation_text.find("```", json_start)
+                    json_content = validation_text[json_start:json_end].strip()
+                    validation_result = json.loads(json_content)
+                except (json.JSONDecodeError, ValueError):
                     validation_result = {
                         "validation_score": 0.5,
                         "is_correct": None,
@@ -223,23 +203,31 @@ Provide your analysis as a structured JSON response with the following format:
                         "recommendations": ["Manual review recommended"],
                         "summary": validation_text[:1000] + "..." if len(validation_text) > 1000 else validation_text
                     }
-            
-            return {
-                "success": True,
-                "query": query,
-                "league": league,
-                "validation": validation_result,
-                "metadata": {
-                    "user_question": user_question,
-                    "description": description,
-                    "context": context,
-                    "results_length": len(results_str),
-                    "timestamp": datetime.now().isoformat()
+            else:
+                # If not valid JSON, create a structured response
+                validation_result = {
+                    "validation_score": 0.5,
+                    "is_correct": None,
+                    "confidence": 0.3,
+                    "issues_found": ["Unable to parse AI validation response as JSON"],
+                    "insights": [],
+                    "recommendations": ["Manual review recommended"],
+                    "summary": validation_text[:1000] + "..." if len(validation_text) > 1000 else validation_text
                 }
+        
+        return {
+            "success": True,
+            "query": query,
+            "league": league,
+            "validation": validation_result,
+            "metadata": {
+                "user_question": user_question,
+                "description": description,
+                "context": context,
+                "results_length": len(results_str),
+                "timestamp": datetime.now().isoformat()
             }
-            
-        finally:
-            await azure_client.aclose()
+        }
             
     except Exception as e:
         logger.error(f"Validation failed: {str(e)}")
@@ -5,7 +5,6 @@ import logging
 import os
 import re
 from typing import Any, List, Optional
-import aiohttp
 import json
 
 from httpx import HTTPStatusError
@@ -139,6 +138,9 @@ async def webscrape(
             "error": "FIRECRAWL_API_KEY not configured"
         }
     
+    # Import aiohttp only when the tool is actually used
+    import aiohttp
+
     try:
         async with aiohttp.ClientSession() as session:
             if url:
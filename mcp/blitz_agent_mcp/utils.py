@@ -4,10 +4,13 @@ Data serialization utilities for converting DataFrames and other data structures
 
 import re
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from typing import TYPE_CHECKING
 
+import httpx
+
 from .config import MAX_DATA_ROWS, AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_API_VERSION
 
 if TYPE_CHECKING:
@@ -22,8 +25,12 @@ def tokenize(text: str) -> list[str]:
     return [token.lower() for token in re.split(r"[/._-]+", text) if token]
 
 
+@lru_cache(maxsize=1)
 def get_azure_chat_client():
-    """Get an Azure Chat OpenAI client."""
+    """Get the shared Azure Chat OpenAI client (created once per process)."""
+    # Fail before importing openai so the unconfigured path stays cheap
+    if not AZURE_OPENAI_API_KEY or not AZURE_OPENAI_ENDPOINT:
+        raise ValueError("Azure OpenAI credentials not configured")
     from openai import AzureOpenAI
     return AzureOpenAI(
         api_key=AZURE_OPENAI_API_KEY,
@@ -32,12 +39,39 @@ def get_azure_chat_client():
     )
 
 
+# Shared client for outbound HTTP APIs (SportsData.io, Azure OpenAI REST)
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared outbound HTTP client so tools reuse pooled connections."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(timeout=30.0)
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared outbound HTTP client."""
+    global _HTTP_CLIENT
+    client, _HTTP_CLIENT = _HTTP_CLIENT, None
+    if client is not None:
+        await client.aclose()
+
+
 def serialize_response(response: Any) -> Any:
     """Recursively serialize response to handle nested data types."""
+    # Only recurse into containers; scalar cells are returned without a call per value
     if isinstance(response, dict):
-        return {key: serialize_response(value) for key, value in response.items()}
+        return {
+            key: serialize_response(value) if isinstance(value, (dict, list)) else value
+            for key, value in response.items()
+        }
     elif isinstance(response, list):
-        return [serialize_response(item) for item in response]
+        return [
+            serialize_response(item) if isinstance(item, (dict, list)) else item
+            for item in response
+        ]
     else:
         return response
 
@@ -8,6 +8,9 @@ import asyncio
 import logging
 import json
 import random
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, date
 from typing import Optional, Any, Dict, List
 from pathlib import Path
@@ -63,6 +66,30 @@ EXCLUDED_KEYWORDS = [
     "Lamar Jackson", "Josh Allen", "Patrick Mahomes", "Super Bowl", "NFL Draft"
 ]
 
+# Canned analytics questions, and the subset mentioning each name we adapt to
+QUESTION_EXAMPLES = (
+    "@BlitzAIBot What's Stephen Curry's three-point percentage from different court zones this season?",
+    "@BlitzAIBot How do the Celtics perform in clutch situations compared to last season?",
+    "@BlitzAIBot Which NBA rookie has the best advanced stats so far this year?",
+    "@BlitzAIBot What's the impact of rest days on LeBron's performance at his age?",
+    "@BlitzAIBot How do the Lakers' defensive ratings change with different lineup combinations?",
+    "@BlitzAIBot Which team has the most efficient offense in close games this season?",
+    "@BlitzAIBot What's Giannis's scoring efficiency in the paint vs. previous seasons?",
+    "@BlitzAIBot How do the Warriors' ball movement stats compare to their championship years?",
+)
+ADAPTABLE_NAMES = ("lebron", "curry", "lakers", "warriors", "celtics")
+_ADAPTED_QUESTIONS = {
+    name: tuple(q for q in QUESTION_EXAMPLES if name in q.lower())
+    for name in ADAPTABLE_NAMES
+}
+
+# Number of most recent processed tweet IDs kept in memory and on disk
+MAX_PROCESSED_TWEETS = 1000
+
+# Single-pass matchers over lowercased tweet text (plain substring semantics)
+_NBA_KEYWORD_RE = re.compile("|".join(re.escape(keyword.lower()) for keyword in NBA_KEYWORDS))
+_EXCLUDED_KEYWORD_RE = re.compile("|".join(re.escape(keyword.lower()) for keyword in EXCLUDED_KEYWORDS))
+
 # System prompt for NBA analytics (same as blitzagent)
 NBA_ANALYTICS_PROMPT = """
 You are an AI sports analytics agent with deep expertise in NBA data.
@@ -113,6 +140,14 @@ Today's Date: {current_date}
 {user_context}
 """
 
+@lru_cache(maxsize=8)
+def _render_nba_prompt(current_date: str, user_context: str) -> str:
+    """Render the NBA analytics system prompt for a (date, context) pair."""
+    return NBA_ANALYTICS_PROMPT.format(
+        current_date=current_date,
+        user_context=f"\n\n### Additional Context:\n{user_context}" if user_context else ""
+    )
+
 class TwitterNBAAgent:
     def __init__(self):
         """Initialize the Twitter NBA agent with Claude 4 Sonnet and MCP tools."""
@@ -184,10 +219,7 @@ class TwitterNBAAgent:
         @self.agent.system_prompt
         def get_system_prompt(ctx) -> str:
             user_context = ctx.deps if ctx.deps else ""
-            return NBA_ANALYTICS_PROMPT.format(
-                current_date=datetime.now().strftime("%Y-%m-%d"),
-                user_context=f"\n\n### Additional Context:\n{user_context}" if user_context else ""
-            )
+            return _render_nba_prompt(datetime.now().strftime("%Y-%m-%d"), user_context)
         
         # Initialize Twitter clients
         self._setup_twitter_clients()
@@ -230,26 +262,28 @@ class TwitterNBAAgent:
         
         logger.info("Twitter clients initialized successfully")
     
-    def _load_processed_tweets(self) -> set:
-        """Load processed tweet IDs from file."""
+    def _load_processed_tweets(self) -> "OrderedDict[str, None]":
+        """Load processed tweet IDs from file, oldest first."""
         try:
             if os.path.exists(self.processed_tweets_file):
                 with open(self.processed_tweets_file, 'r') as f:
                     data = json.load(f)
-                    return set(data.get('processed_tweet_ids', []))
-            return set()
+                    tweet_ids = data.get('processed_tweet_ids', [])[-MAX_PROCESSED_TWEETS:]
+                    return OrderedDict.fromkeys(tweet_ids)
+            return OrderedDict()
         except Exception as e:
             logger.error(f"Error loading processed tweets: {e}")
-            return set()
+            return OrderedDict()
     
     def _save_processed_tweet(self, tweet_id: str):
         """Save a processed tweet ID."""
         try:
-            self.processed_tweets.add(tweet_id)
+            self.processed_tweets[tweet_id] = None
+            self.processed_tweets.move_to_end(tweet_id)
             
-            # Keep only last 1000 to prevent file growth
-            if len(self.processed_tweets) > 1000:
-                self.processed_tweets = set(list(self.processed_tweets)[-1000:])
+            # Keep only the most recent IDs to prevent file growth
+            while len(self.processed_tweets) > MAX_PROCESSED_TWEETS:
+                self.processed_tweets.popitem(last=False)
             
             data = {
                 'processed_tweet_ids': list(self.processed_tweets),
@@ -277,7 +311,8 @@ class TwitterNBAAgent:
             
             for query in search_queries:
                 try:
-                    tweets = self.blitzanalytics_client.search_recent_tweets(
+                    tweets = await asyncio.to_thread(
+                        self.blitzanalytics_client.search_recent_tweets,
                         query=query,
                         max_results=20,
                         tweet_fields=['created_at', 'author_id', 'public_metrics', 'context_annotations'],
@@ -286,9 +321,9 @@ class TwitterNBAAgent:
                     )
                     
                     if tweets.data:
-                        # Filter and score tweets
-                        scored_tweets = []
-                        users_dict = {user.id: user for user in tweets.includes.get('users', [])}
+                        # Filter and score tweets, keeping only the best one seen so far
+                        tweet_data = None
+                        best_score = None
                         
                         for tweet in tweets.data:
                             # Skip if already processed
@@ -297,7 +332,6 @@ class TwitterNBAAgent:
                             
                             # Check if it's genuine NBA content
                             if self._is_quality_nba_content(tweet.text):
-                                author = users_dict.get(tweet.author_id)
                                 metrics = tweet.public_metrics
                                 
                                 # Score based on engagement
@@ -308,17 +342,16 @@ class TwitterNBAAgent:
                                     metrics['quote_count'] * 2
                                 )
                                 
-                                scored_tweets.append({
-                                    'tweet': tweet,
-                                    'author': author,
-                                    'score': score
-                                })
+                                if best_score is None or score > best_score:
+                                    tweet_data = tweet
+                                    best_score = score
                         
-                        if scored_tweets:
-                            # Sort by score and return best one
-                            best_tweet = max(scored_tweets, key=lambda x: x['score'])
-                            tweet_data = best_tweet['tweet']
-                            author = best_tweet['author']
+                        if tweet_data is not None:
+                            # Only the winning tweet's author is needed
+                            author = next(
+                                (user for user in tweets.includes.get('users', []) if user.id == tweet_data.author_id),
+                                None
+                            )
                             
                             content = TwitterContent(
                                 id=str(tweet_data.id),  # Convert to string
@@ -328,7 +361,7 @@ class TwitterNBAAgent:
                                 created_at=tweet_data.created_at.isoformat() if tweet_data.created_at else ""
                             )
                             
-                            logger.info(f"Found NBA content: {content.text[:80]}... (Score: {best_tweet['score']})")
+                            logger.info(f"Found NBA content: {content.text[:80]}... (Score: {best_score})")
                             return content
                 
                 except Exception as e:
@@ -347,26 +380,23 @@ class TwitterNBAAgent:
     
     def _is_quality_nba_content(self, text: str) -> bool:
         """Check if tweet contains quality NBA content."""
-        text_lower = text.lower()
-        
-        # Must contain NBA keywords
-        has_nba_keyword = any(keyword.lower() in text_lower for keyword in NBA_KEYWORDS)
-        if not has_nba_keyword:
+        # Basic quality checks first; they reject without lowercasing or keyword scans
+        if len(text) < 20:  # Too short
             return False
         
-        # Must not contain excluded keywords
-        has_excluded = any(keyword.lower() in text_lower for keyword in EXCLUDED_KEYWORDS)
-        if has_excluded:
+        if text.count('#') > 5:  # Too many hashtags
             return False
         
-        # Basic quality checks
-        if len(text) < 20:  # Too short
+        text_lower = text.lower()
+        if text_lower.count('http') > 2:  # Too many links
             return False
         
-        if text.count('#') > 5:  # Too many hashtags
+        # Must contain NBA keywords
+        if not _NBA_KEYWORD_RE.search(text_lower):
             return False
         
-        if 'http' in text_lower and text_lower.count('http') > 2:  # Too many links
+        # Must not contain excluded keywords
+        if _EXCLUDED_KEYWORD_RE.search(text_lower):
             return False
         
         return True
@@ -374,71 +404,17 @@ class TwitterNBAAgent:
     async def generate_analytics_question(self, content: Optional[TwitterContent] = None) -> str:
         """Generate an engaging NBA analytics question."""
         try:
-            if content:
-                # Generate contextual question based on content
-                context = f"Based on this NBA content: '{content.text}'"
-                prompt = f"""Generate an engaging NBA analytics question that relates to this content: "{content.text}"
-
-The question should:
-- Be specific and answerable with NBA data/statistics
-- Encourage analytical discussion
-- Be interesting to basketball fans
-- Be suitable for Twitter (concise but engaging)
-- Start with "@BlitzAIBot" to trigger the analytics response
-
-Examples:
-- "@BlitzAIBot What's LeBron's clutch shooting percentage this season compared to his career average?"
-- "@BlitzAIBot How do the Lakers' defensive stats compare when Anthony Davis plays vs sits?"
-- "@BlitzAIBot Which team has the best three-point defense in the league right now?"
-
-Generate ONE question only, no explanation."""
-            else:
-                # Generate standalone question
-                question_templates = [
-                    "player performance analysis",
-                    "team comparison",
-                    "historical records",
-                    "current season trends",
-                    "clutch performance",
-                    "defensive statistics",
-                    "scoring efficiency",
-                    "playoff implications"
-                ]
-                
-                topic = random.choice(question_templates)
-                prompt = f"""Generate an engaging NBA analytics question about {topic}.
-
-The question should:
-- Be specific and answerable with NBA data/statistics  
-- Encourage analytical discussion
-- Be interesting to basketball fans
-- Be suitable for Twitter (concise but engaging)
-- Start with "@BlitzAIBot" to trigger the analytics response
-
-Generate ONE question only, no explanation."""
-                context = ""
-            
             # Use a simple text-based approach for question generation
             # since this is about generating creative questions, not complex analytics
-            question_examples = [
-                "@BlitzAIBot What's Stephen Curry's three-point percentage from different court zones this season?",
-                "@BlitzAIBot How do the Celtics perform in clutch situations compared to last season?",
-                "@BlitzAIBot Which NBA rookie has the best advanced stats so far this year?",
-                "@BlitzAIBot What's the impact of rest days on LeBron's performance at his age?",
-                "@BlitzAIBot How do the Lakers' defensive ratings change with different lineup combinations?",
-                "@BlitzAIBot Which team has the most efficient offense in close games this season?",
-                "@BlitzAIBot What's Giannis's scoring efficiency in the paint vs. previous seasons?",
-                "@BlitzAIBot How do the Warriors' ball movement stats compare to their championship years?"
-            ]
-            
             # For now, use a random question with some contextual adaptation
-            base_question = random.choice(question_examples)
+            base_question = random.choice(QUESTION_EXAMPLES)
             
-            if content and any(name in content.text.lower() for name in ['lebron', 'curry', 'lakers', 'warriors', 'celtics']):
-                # Try to adapt question to content
-                for name in ['lebron', 'curry', 'lakers', 'warriors', 'celtics']:
-                    if name in content.text.lower():
-                        adapted_questions = [q for q in question_examples if name in q.lower()]
+            if content:
+                # Try to adapt question to the first known name in the content
+                content_lower = content.text.lower()
+                for name in ADAPTABLE_NAMES:
+                    if name in content_lower:
+                        adapted_questions = _ADAPTED_QUESTIONS[name]
                         if adapted_questions:
                             base_question = random.choice(adapted_questions)
                             break
@@ -462,13 +438,14 @@ Generate ONE question only, no explanation."""
             
             if reply_to_tweet_id:
                 # Post as reply
-                response = self.tejsri_client.create_tweet(
+                response = await asyncio.to_thread(
+                    self.tejsri_client.create_tweet,
                     text=question,
                     in_reply_to_tweet_id=reply_to_tweet_id
                 )
             else:
                 # Post standalone
-                response = self.tejsri_client.create_tweet(text=question)
+                response = await asyncio.to_thread(self.tejsri_client.create_tweet, text=question)
             
             if response.data:
                 question_tweet_id = response.data['id']
@@ -532,7 +509,8 @@ Generate ONE question only, no explanation."""
                 return "test_analytics_tweet_id"
             
             # Post as reply to the question
-            twitter_response = self.blitzai_client.create_tweet(
+            twitter_response = await asyncio.to_thread(
+                self.blitzai_client.create_tweet,
                 text=response,
                 in_reply_to_tweet_id=question_tweet_id
             )
@@ -560,6 +538,7 @@ Generate ONE question only, no explanation."""
             "steps": {},
             "test_mode": request.test_mode
         }
+        analytics_task = None
         
         try:
             logger.info("🏀 Starting NBA Twitter Workflow")
@@ -596,17 +575,26 @@ Generate ONE question only, no explanation."""
                 logger.error("Failed to post question - stopping workflow")
                 return workflow_result
             
-            # Mark content as processed
+            # The analytics answer only needs the question text; start it once the
+            # question is up so it runs during the wait below
+            analytics_task = asyncio.create_task(self.generate_analytics_response(question))
+            
+            # Mark content as processed; the file write overlaps with the wait below
+            save_task = None
             if nba_content:
-                self._save_processed_tweet(nba_content.id)
+                save_task = asyncio.create_task(
+                    asyncio.to_thread(self._save_processed_tweet, nba_content.id)
+                )
             
             # Step 4: Wait briefly
             logger.info("Step 4: Waiting before analytics response...")
             await asyncio.sleep(3)
+            if save_task:
+                await save_task
             
             # Step 5: Generate analytics response
             logger.info("Step 5: Generating comprehensive analytics...")
-            analytics_response = await self.generate_analytics_response(question)
+            analytics_response = await analytics_task
             workflow_result["steps"]["analytics_generation"] = {
                 "success": bool(analytics_response),
                 "response": analytics_response
@@ -632,6 +620,8 @@ Generate ONE question only, no explanation."""
             
         except Exception as e:
             logger.error(f"Error in NBA workflow: {e}")
+            if analytics_task and not analytics_task.done():
+                analytics_task.cancel()
             workflow_result["error"] = str(e)
             return workflow_result
 
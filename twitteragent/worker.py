@@ -11,7 +11,7 @@ import logging
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import signal
 import sys
@@ -37,6 +37,8 @@ class NBAWorkerScheduler:
         self.is_running = False
         self.execution_log_file = "execution_log.json"
         self.status_file = "worker_status.json"
+        self._last_status: Optional[Dict[str, Any]] = None  # Last status written by this process
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Reused by every scheduled run
         self.execution_history = self._load_execution_history()
         self.setup_signal_handlers()
         
@@ -109,6 +111,8 @@ class NBAWorkerScheduler:
                 'last_execution': last_execution
             }
             
+            self._last_status = status_data
+            
             with open(self.status_file, 'w') as f:
                 json.dump(status_data, f, indent=2)
                 
@@ -133,6 +137,7 @@ class NBAWorkerScheduler:
     async def execute_workflow(self, test_mode: bool = False) -> Dict[str, Any]:
         """Execute the NBA Twitter workflow."""
         execution_start = datetime.now()
+        start_ns = time.perf_counter_ns()  # Integer monotonic clock for the duration
         logger.info(f"🚀 Starting NBA workflow execution at {execution_start}")
         
         execution_result = {
@@ -169,22 +174,26 @@ class NBAWorkerScheduler:
             execution_result['success'] = False
         
         finally:
-            execution_end = datetime.now()
-            execution_result['end_time'] = execution_end.isoformat()
-            execution_result['duration_seconds'] = (execution_end - execution_start).total_seconds()
+            execution_result['end_time'] = datetime.now().isoformat()
+            execution_result['duration_seconds'] = (time.perf_counter_ns() - start_ns) / 1e9
             
-            # Log execution
+            # Log execution and update status, keeping the disk writes off the event loop
             self.execution_history.append(execution_result)
-            self._save_execution_history()
-            
-            # Update status
             status_msg = "Execution completed successfully" if execution_result['success'] else "Execution failed"
-            self._update_status("running", status_msg, execution_result)
+            await asyncio.to_thread(self._persist_execution, status_msg, execution_result)
             
             logger.info(f"⏱️ Execution duration: {execution_result['duration_seconds']:.2f} seconds")
         
         return execution_result
     
+    def _persist_execution(self, status_msg: str, execution_result: Dict[str, Any]):
+        """Save execution history and status, logging instead of raising on failure."""
+        try:
+            self._save_execution_history()
+            self._update_status("running", status_msg, execution_result)
+        except Exception as e:
+            logger.error(f"Error persisting execution {execution_result.get('execution_id')}: {e}")
+    
     def schedule_jobs(self):
         """Schedule all NBA workflow jobs."""
         logger.info("Setting up scheduled jobs...")
@@ -204,17 +213,29 @@ class NBAWorkerScheduler:
             try:
                 # Try to get the current event loop
                 asyncio.get_running_loop()
-                # We're in an event loop, need to run in a new thread with new loop
+                # We're in an event loop, so drive the worker loop from another thread
                 self._run_in_new_thread()
             except RuntimeError:
-                # No running event loop, safe to use asyncio.run()
-                asyncio.run(self.execute_workflow(test_mode=False))
+                # No running event loop, run on the scheduler's own loop
+                self._run_on_worker_loop(self.execute_workflow(test_mode=False))
                 
         except Exception as e:
             logger.error(f"Error in scheduled workflow: {e}")
     
+    def _run_on_worker_loop(self, coro):
+        """Run a coroutine on the scheduler's persistent event loop.
+
+        Reusing one loop keeps the agent's async clients bound to a live loop
+        between runs instead of creating and tearing one down each time.
+        Scheduled runs are serialised, so the loop is never driven by two
+        threads at once.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
     def _run_in_new_thread(self):
-        """Run workflow in a new thread with its own event loop."""
+        """Run workflow on the persistent worker loop from a separate thread."""
         import threading
         import queue
         
@@ -222,18 +243,11 @@ class NBAWorkerScheduler:
         
         def thread_worker():
             try:
-                # Create a new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                # Run the workflow
-                result = loop.run_until_complete(self.execute_workflow(test_mode=False))
+                result = self._run_on_worker_loop(self.execute_workflow(test_mode=False))
                 result_queue.put(('success', result))
                 
             except Exception as e:
                 result_queue.put(('error', e))
-            finally:
-                loop.close()
         
         # Start thread and wait for completion
         thread = threading.Thread(target=thread_worker)
@@ -289,11 +303,18 @@ class NBAWorkerScheduler:
         logger.info("🛑 Stopping NBA Worker Scheduler")
         self.is_running = False
         schedule.clear()
+        if self._loop is not None and not self._loop.is_running():
+            self._loop.close()
+            self._loop = None
         self._update_status("stopped", "Scheduler stopped")
         logger.info("👋 NBA Worker Scheduler stopped")
     
     def get_status(self) -> Dict[str, Any]:
         """Get current worker status."""
+        # Serve the status this process last wrote instead of re-reading the file
+        if self._last_status is not None:
+            return dict(self._last_status)
+        
         try:
             if os.path.exists(self.status_file):
                 with open(self.status_file, 'r') as f:
@@ -318,16 +339,22 @@ class NBAWorkerScheduler:
                 'last_execution': None
             }
         
-        successful = sum(1 for exec in self.execution_history if exec.get('success', False))
-        failed = len(self.execution_history) - successful
+        # Tally successes and durations in a single pass over the history
+        total = len(self.execution_history)
+        successful = 0
+        total_duration = 0
+        for exec in self.execution_history:
+            if exec.get('success', False):
+                successful += 1
+            total_duration += exec.get('duration_seconds', 0)
         
         return {
-            'total_executions': len(self.execution_history),
+            'total_executions': total,
             'successful_executions': successful,
-            'failed_executions': failed,
-            'success_rate': (successful / len(self.execution_history)) * 100,
-            'last_execution': self.execution_history[-1] if self.execution_history else None,
-            'average_duration': sum(exec.get('duration_seconds', 0) for exec in self.execution_history) / len(self.execution_history)
+            'failed_executions': total - successful,
+            'success_rate': (successful / total) * 100,
+            'last_execution': self.execution_history[-1],
+            'average_duration': total_duration / total
         }
 
 # Global scheduler instance
@@ -21,6 +21,11 @@ ACCESS_TOKEN = os.getenv("X_ACCESS_TOKEN")
 ACCESS_TOKEN_SECRET = os.getenv("X_ACCESS_SECRET")
 BOT_USERNAME = os.getenv("X_BOT_NAME")  # e.g. "@MyBot"
 
+# Derived forms of the bot username, computed once instead of per mention
+BOT_HANDLE = BOT_USERNAME.lstrip("@") if BOT_USERNAME else None  # e.g. "MyBot"
+BOT_MENTION_TOKEN = BOT_USERNAME.lower() if BOT_USERNAME else None
+BOT_MENTION_RE = re.compile(re.escape(BOT_MENTION_TOKEN)) if BOT_USERNAME else None
+
 # BlitzAgent API configuration
 BLITZAGENT_API_URL = "https://blitzagent.onrender.com"
 BLITZAGENT_API_KEY = os.getenv("BLITZAGENT_API_KEY")  # Required: Add this to your .env file
@@ -44,6 +49,15 @@ client = AsyncClient(
 replied_threads = set()
 bot_user_id = None
 
+# Tweet fields requested on every mention poll
+MENTION_TWEET_FIELDS = [
+    "author_id",
+    "referenced_tweets",
+    "text",
+    "created_at",
+    "in_reply_to_user_id",
+]
+
 async def has_explicit_mention(tweet) -> bool:
     """
     Determines if the bot was explicitly mentioned.
@@ -57,8 +71,9 @@ async def has_explicit_mention(tweet) -> bool:
     print(f"Bot user ID: {bot_user_id}")
 
     text = tweet.text or ""
-    token = BOT_USERNAME.lower()
-    mention_count = text.lower().count(token)
+    token = BOT_MENTION_TOKEN
+    text_lower = text.lower()
+    mention_count = text_lower.count(token)
     print(f"Bot mention count in this tweet: {mention_count}")
 
     if mention_count == 0:
@@ -98,7 +113,7 @@ async def has_explicit_mention(tweet) -> bool:
                 pass
 
     # If not a reply or couldn't fetch parent — use position logic
-    positions = [m.start() for m in re.finditer(re.escape(token), text.lower())]
+    positions = [m.start() for m in BOT_MENTION_RE.finditer(text_lower)]
     print(f"Found {len(positions)} mentions at positions: {positions}")
 
     if len(positions) > 1:
@@ -113,6 +128,19 @@ async def has_explicit_mention(tweet) -> bool:
     print("Single mention at start, not replying to bot — treating as explicit")
     return True
 
+async def fetch_comment_highlights(original_tweet_id):
+    """Fetch the top 20 replies to the original tweet as a newline-joined string."""
+    query = f"conversation_id:{original_tweet_id} -from:{BOT_HANDLE}"
+    try:
+        replies_resp = await client.search_recent_tweets(query=query, max_results=20, tweet_fields=["text", "public_metrics", "author_id"])
+        replies = replies_resp.data if replies_resp and replies_resp.data else []
+        replies = sorted(replies, key=lambda x: x.public_metrics.get("like_count", 0) if hasattr(x, "public_metrics") else 0, reverse=True)
+        top_replies = replies[:20]
+        return "\n".join([reply.text for reply in top_replies])
+    except Exception as e:
+        print(f"Error fetching replies: {e}")
+        return None
+
 async def process_mention(tweet):
     # Ignore retweets and tweets from the bot itself
     if tweet.author_id == bot_user_id or tweet.text.startswith("RT"):
@@ -128,49 +156,51 @@ async def process_mention(tweet):
     current_author = None
     current_author_username = None
     current_author = tweet.author_id
-    user_resp = await client.get_user(id=current_author)
+    replied_to_id = None
+    for ref in tweet.referenced_tweets or []:
+        if ref["type"] == "replied_to":
+            replied_to_id = ref["id"]
+            break
+
+    # The current author lookup and the parent tweet fetch are independent
+    if replied_to_id:
+        user_resp, original_tweet = await asyncio.gather(
+            client.get_user(id=current_author),
+            client.get_tweet(replied_to_id, tweet_fields=["text", "author_id"]),
+        )
+    else:
+        user_resp = await client.get_user(id=current_author)
+        original_tweet = None
     if user_resp and user_resp.data:
         current_author_username = user_resp.data.username
 
-    if tweet.referenced_tweets:
-        for ref in tweet.referenced_tweets:
-            if ref["type"] == "replied_to":
-                original_tweet = await client.get_tweet(ref["id"], tweet_fields=["text", "author_id"])
-                print(original_tweet)
-                if original_tweet and original_tweet.data:
-                    thread_content = original_tweet.data["text"]
-                    original_tweet_id = original_tweet.data["id"]
-                    original_author = original_tweet.data["author_id"]
-                    # Fetch the username of the original author
-                    user_resp = await client.get_user(id=original_author)
-                    if user_resp and user_resp.data:
-                        original_author_username = user_resp.data.username
-    # Fetch top 20 replies to the original tweet (if thread context exists)
     comment_highlights = None
-    if original_tweet_id:
-        query = f"conversation_id:{original_tweet_id} -from:{BOT_USERNAME.lstrip('@')}"
-        try:
-            replies_resp = await client.search_recent_tweets(query=query, max_results=20, tweet_fields=["text", "public_metrics", "author_id"])
-            replies = replies_resp.data if replies_resp and replies_resp.data else []
-            replies = sorted(replies, key=lambda x: x.public_metrics.get("like_count", 0) if hasattr(x, "public_metrics") else 0, reverse=True)
-            top_replies = replies[:20]
-            comments_text = "\n".join([reply.text for reply in top_replies])
-            comment_highlights = comments_text
-        except Exception as e:
-            print(f"Error fetching replies: {e}")
-            comment_highlights = None
+    if original_tweet:
+        print(original_tweet)
+        if original_tweet.data:
+            thread_content = original_tweet.data["text"]
+            original_tweet_id = original_tweet.data["id"]
+            original_author = original_tweet.data["author_id"]
+            # Fetch the username of the original author alongside the top replies
+            user_resp, comment_highlights = await asyncio.gather(
+                client.get_user(id=original_author),
+                fetch_comment_highlights(original_tweet_id),
+            )
+            if user_resp and user_resp.data:
+                original_author_username = user_resp.data.username
     user_question = tweet.text.replace(BOT_USERNAME, "").strip()
     
     # Build extra context for Twitter response
-    extra_context = "This is a Twitter reply. Keep response under 250 characters and be concise."
+    context_parts = ["This is a Twitter reply. Keep response under 250 characters and be concise."]
     if thread_content:
-        extra_context += f" Original tweet: {thread_content}"
+        context_parts.append(f" Original tweet: {thread_content}")
         if original_author_username:
-            extra_context += f" (by @{original_author_username})"
+            context_parts.append(f" (by @{original_author_username})")
     if current_author_username:
-        extra_context += f" Current user: @{current_author_username}"
+        context_parts.append(f" Current user: @{current_author_username}")
     if comment_highlights:
-        extra_context += f" Top replies context: {comment_highlights[:500]}..."  # Limit context size
+        context_parts.append(f" Top replies context: {comment_highlights[:500]}...")  # Limit context size
+    extra_context = "".join(context_parts)
     
     payload = {
         "query": user_question,
@@ -248,16 +278,9 @@ async def main():
             five_minutes_ago = datetime.datetime.now(datetime.UTC) - datetime.timedelta(minutes=5)
             start_time_str = five_minutes_ago.strftime("%Y-%m-%dT%H:%M:%SZ")
             
-            query = f"@{BOT_USERNAME.lstrip('@')}"
             search_kwargs = {
-                "query": f"@{BOT_USERNAME.lstrip('@')}",
-                "tweet_fields": [
-                    "author_id",
-                    "referenced_tweets", 
-                    "text",
-                    "created_at",
-                    "in_reply_to_user_id",
-                ],
+                "query": f"@{BOT_HANDLE}",
+                "tweet_fields": MENTION_TWEET_FIELDS,
                 "max_results": 100,
             }
 
@@ -290,4 +313,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file